@@ -11,8 +11,14 @@ Handles:
 Uses asyncio for parallel API calls to minimize latency.
 """
 
+import functools
+import io
+import json
+import math
+import threading
 import time
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import sounddevice as sd
 import wave
@@ -39,62 +45,184 @@ from config import (
     MAX_RECORDING_DURATION
 )
 
+# Optional streaming transcription settings (keep backwards compatible)
+try:
+    import config as _cfg
+
+    ENABLE_STREAMING_TRANSCRIPTION = bool(getattr(_cfg, "ENABLE_STREAMING_TRANSCRIPTION", True))
+    STREAMING_SEGMENT_MIN_S = float(getattr(_cfg, "STREAMING_SEGMENT_MIN_S", 4.0) or 4.0)
+    SAVE_AUDIO_FILES = bool(getattr(_cfg, "SAVE_AUDIO_FILES", False))
+except Exception:
+    ENABLE_STREAMING_TRANSCRIPTION = True
+    STREAMING_SEGMENT_MIN_S = 4.0
+    SAVE_AUDIO_FILES = False
+
+# Streaming segments are only cut inside a real pause: at least PAUSE_MIN_S of
+# consecutive blocks quieter than SILENCE_RATIO x the loudest block so far. The
+# threshold follows the recording's own level because quiet mics are boosted
+# by normalization afterwards, so a fixed raw RMS would cut them mid-word.
+PAUSE_MIN_S = 0.3
+SILENCE_RATIO = 0.1
+
+# A voiced tail shorter than this is merged into the last segment (Whisper
+# rejects clips under 0.1s); a silent tail is dropped
+TAIL_MIN_S = 0.5
+
+# How long to wait for a Hume.ai job to complete before giving up
+HUME_POLL_TIMEOUT_S = 5.0
+
+# Minimum time between recording visualization updates (matches Live refresh rate)
+UI_UPDATE_INTERVAL_S = 0.1
+
 console = Console()
 
 
 # ============ AUDIO FEEDBACK ============
 
-def play_beep(frequency=800, duration=0.1, volume=0.3):
-    """Play a simple beep tone for audio feedback."""
+BEEP_SAMPLE_RATE = 44100
+
+# Feedback beeps as (frequency Hz, duration s, volume); all are precomputed below
+START_BEEP = (900, 0.1, 0.3)
+STOP_BEEP = (700, 0.12, 0.3)
+SUBMIT_BEEP = (1200, 0.15, 0.25)
+
+# Check once for an output device; without one every beep is a no-op
+try:
+    _HAS_AUDIO_OUTPUT = bool(sd.query_devices(kind='output'))
+except Exception:
+    _HAS_AUDIO_OUTPUT = False
+
+
+@functools.cache
+def _tone(frequency, duration, volume):
+    """Sine tone buffer, cached: only a handful of fixed beeps are ever played."""
+    t = np.arange(int(BEEP_SAMPLE_RATE * duration)) / BEEP_SAMPLE_RATE
+    tone = (volume * np.sin(2 * np.pi * frequency * t)).astype(np.float32)
+    tone.flags.writeable = False  # Shared between calls
+    return tone
+
+
+@functools.cache
+def _double_tone():
+    """Both screenshot-mode beeps and the gap between them as one buffer."""
+    gap = np.zeros(int(BEEP_SAMPLE_RATE * 0.05), dtype=np.float32)
+    tone = np.concatenate([_tone(800, 0.08, 0.25), gap, _tone(1000, 0.08, 0.25)])
+    tone.flags.writeable = False
+    return tone
+
+
+def _play(tone):
+    """Play a tone buffer and wait for it to finish."""
+    if not _HAS_AUDIO_OUTPUT:
+        return
     try:
-        sample_rate = 44100
-        samples = int(sample_rate * duration)
-        t = np.linspace(0, duration, samples, False)
-        tone = volume * np.sin(2 * np.pi * frequency * t)
-        sd.play(tone, sample_rate)
+        sd.play(tone, BEEP_SAMPLE_RATE)
         sd.wait()
     except Exception:
         pass  # Don't let beep failures break the app
 
 
+def play_beep(frequency=800, duration=0.1, volume=0.3):
+    """Play a simple beep tone for audio feedback."""
+    _play(_tone(frequency, duration, volume))
+
+
 def play_double_beep():
     """Play double beep for screenshot + audio mode."""
-    try:
-        play_beep(800, 0.08, 0.25)
-        time.sleep(0.05)
-        play_beep(1000, 0.08, 0.25)
-    except Exception:
-        pass
+    _play(_double_tone())
 
 
 def play_start_beep():
     """Play single beep for audio-only mode start."""
-    play_beep(900, 0.1, 0.3)
+    play_beep(*START_BEEP)
 
 
 def play_stop_beep():
     """Play beep when recording stops."""
-    play_beep(700, 0.12, 0.3)
+    play_beep(*STOP_BEEP)
 
 
 def play_submit_beep():
     """Play beep when message is submitted."""
-    play_beep(1200, 0.15, 0.25)
+    play_beep(*SUBMIT_BEEP)
+
+
+# Precompute every feedback tone so a key press does no synthesis
+for _beep in (START_BEEP, STOP_BEEP, SUBMIT_BEEP):
+    _tone(*_beep)
+del _beep
+_double_tone()
 
 
 # ============ AUDIO RECORDING ============
 
+def normalization_gain(audio_data, verbose=False):
+    """
+    Gain that brings audio to ~90% peak for better Whisper transcription.
+    
+    Boost is capped at 10x; audio too quiet to normalize gets 1.0.
+    """
+    # max/min reductions avoid the full-size temporary that np.abs() would allocate
+    peak = float(max(audio_data.max(), -audio_data.min()))
+    if peak > 0.05:
+        scaling_factor = min(0.9 / peak, 10.0)
+        if verbose:
+            console.print(f"[dim]   🔊 Normalized audio (boost: {scaling_factor:.1f}x, peak: {peak:.2f})[/dim]")
+        return scaling_factor
+    if peak > 0 and verbose:
+        console.print(f"[dim]   🔇 Audio too quiet to normalize (peak: {peak:.2f})[/dim]")
+    return 1.0
+
+
+def encode_wav(audio_data, gain=1.0):
+    """Encode float32 samples as in-memory 16-bit PCM WAV bytes, applying gain in the same pass."""
+    # Scale and convert straight into the int16 buffer (no float temporary)
+    audio_int16 = np.empty(audio_data.shape, dtype=np.int16)
+    np.multiply(audio_data, 32767 * gain, out=audio_int16, casting='unsafe')
+    
+    buf = io.BytesIO()
+    with wave.open(buf, 'wb') as wf:
+        wf.setnchannels(AUDIO_CHANNELS)
+        wf.setsampwidth(2)
+        wf.setframerate(AUDIO_SAMPLE_RATE)
+        # wave accepts any buffer; passing the array avoids a tobytes() copy
+        wf.writeframes(audio_int16)
+    return buf.getvalue()
+
+
 class AudioRecorder:
     """Push-to-talk audio recorder with live visualization."""
     
+    # Full-width level bars; the callback slices these instead of building strings
+    _BAR_LOUD = "█" * 40
+    _BAR_MEDIUM = "▓" * 40
+    _BAR_QUIET = "░" * 40
+    
     def __init__(self):
         self.is_recording = False
-        self.audio_chunks = []
+        # One preallocated buffer for the longest allowed recording; the callback
+        # copies each block in at the write cursor instead of allocating per block
+        self._capacity = int(MAX_RECORDING_DURATION * AUDIO_SAMPLE_RATE)
+        self._buffer = np.empty((self._capacity, AUDIO_CHANNELS), dtype=np.float32)
+        self.frames_recorded = 0
         self.stream = None
         self.capture_screenshot = True
         self.screenshot_path = None
+        # Window under the cursor at key press, captured if no region is dragged
+        self.fallback_window_id = None
+        self.fallback_app_name = None
+        self.fallback_bounds = None
         self.live_display = None
         self.start_time = None
+        self._last_ui_update = 0.0
+        # Streaming transcription: called with a view of the buffer each time a
+        # segment is cut at a pause while recording
+        self.on_segment = None
+        self.segment_start = 0  # Frame index where the uncut tail begins
+        self.prev_segment_start = 0  # Frame index where the last cut segment begins
+        self.tail_voiced = False  # Whether the uncut tail contains any speech
+        self._peak_rms = 0.0
+        self._pause_start = None  # Frame index where the current pause began
     
     def start_recording(self, take_screenshot=False, window_id=None, app_name=None, window_bounds=None):
         """Start recording audio. Optionally capture screenshot of specified window."""
@@ -102,8 +230,13 @@ class AudioRecorder:
             return
         
         self.is_recording = True
-        self.audio_chunks = []
+        self.frames_recorded = 0
         self.screenshot_path = None
+        self.segment_start = 0
+        self.prev_segment_start = 0
+        self.tail_voiced = False
+        self._peak_rms = 0.0
+        self._pause_start = None
         
         # Note: Screenshot capture is handled by main script before calling audio processor
         # The take_screenshot parameter is kept for API compatibility but not used
@@ -119,13 +252,46 @@ class AudioRecorder:
                 console.print(f"\n[yellow]⚠ Max recording duration ({MAX_RECORDING_DURATION}s) reached, stopping...[/yellow]")
                 raise sd.CallbackAbort()
             
-            # Calculate RMS (volume level)
-            rms = np.sqrt(np.mean(indata**2))
+            # Calculate RMS (volume level) in one fused pass without a temporary array
+            samples = indata.reshape(-1)
+            rms = math.sqrt(float(np.dot(samples, samples)) / samples.size)
             
             # Store audio data
-            self.audio_chunks.append(indata.copy())
+            start = self.frames_recorded
+            if start + frames > self._capacity:
+                # Buffer holds exactly MAX_RECORDING_DURATION of audio
+                raise sd.CallbackAbort()
+            self._buffer[start:start + frames] = indata
+            self.frames_recorded = start + frames
+            
+            # Cut a segment at the first pause once enough audio has accumulated,
+            # so it can be transcribed while the user is still talking
+            if self.on_segment:
+                end = self.frames_recorded
+                self._peak_rms = max(self._peak_rms, rms)
+                if rms >= SILENCE_RATIO * self._peak_rms:
+                    self._pause_start = None
+                    self.tail_voiced = True
+                else:
+                    if self._pause_start is None:
+                        self._pause_start = start
+                    # Cut in the middle of the pause, so the words on either
+                    # side stay whole in their own segments
+                    if (end - self._pause_start >= PAUSE_MIN_S * AUDIO_SAMPLE_RATE
+                            and self._pause_start - self.segment_start >= STREAMING_SEGMENT_MIN_S * AUDIO_SAMPLE_RATE):
+                        cut = (self._pause_start + end) // 2
+                        self.on_segment(self._buffer[self.segment_start:cut])
+                        self.prev_segment_start = self.segment_start
+                        self.segment_start = cut
+                        self.tail_voiced = False
+            
+            # Update live display with audio visualization. Live only repaints at
+            # 10 Hz, so skip building panels for blocks it would never show.
+            now = time.monotonic()
+            if now - self._last_ui_update < UI_UPDATE_INTERVAL_S:
+                return
+            self._last_ui_update = now
             
-            # Update live display with audio visualization
             if self.live_display and self.start_time:
                 elapsed = time.time() - self.start_time
                 
@@ -134,13 +300,13 @@ class AudioRecorder:
                 bar_length = min(bar_length, 40)
                 
                 if rms > 0.02:
-                    bar = "█" * bar_length
+                    bar = self._BAR_LOUD[:bar_length]
                     color = "green"
                 elif rms > 0.01:
-                    bar = "▓" * bar_length
+                    bar = self._BAR_MEDIUM[:bar_length]
                     color = "yellow"
                 else:
-                    bar = "░" * max(1, bar_length)
+                    bar = self._BAR_QUIET[:max(1, bar_length)]
                     color = "dim"
                 
                 # Format elapsed time
@@ -162,7 +328,7 @@ class AudioRecorder:
         
         try:
             # Start live display
-            self.live_display = Live(console=console, refresh_per_second=10)
+            self.live_display = Live(console=console, refresh_per_second=1 / UI_UPDATE_INTERVAL_S)
             self.live_display.start()
             
             self.stream = sd.InputStream(
@@ -193,8 +359,12 @@ class AudioRecorder:
                     pass
                 self.stream = None
     
+    def recorded_audio(self, start=0):
+        """View of the frames captured so far, from frame index `start`."""
+        return self._buffer[start:self.frames_recorded]
+    
     def stop_recording(self):
-        """Stop recording and save audio file. Returns audio file path or None."""
+        """Stop recording and encode the audio. Returns WAV bytes or None."""
         if not self.is_recording:
             return None
         
@@ -213,40 +383,28 @@ class AudioRecorder:
             
             console.print("[green]✓ Recording stopped[/green]")
             
-            if not self.audio_chunks:
+            if not self.frames_recorded:
                 console.print("[yellow]⚠ No audio recorded[/yellow]")
                 return None
             
-            # Combine all chunks
-            audio_data = np.concatenate(self.audio_chunks, axis=0)
-            
-            # Normalize audio for better Whisper transcription
-            peak = np.max(np.abs(audio_data))
-            if peak > 0:
-                if peak > 0.05:
-                    scaling_factor = 0.9 / peak
-                    scaling_factor = min(scaling_factor, 10.0)
-                    audio_data = audio_data * scaling_factor
-                    console.print(f"[dim]   🔊 Normalized audio (boost: {scaling_factor:.1f}x, peak: {peak:.2f})[/dim]")
-                else:
-                    console.print(f"[dim]   🔇 Audio too quiet to normalize (peak: {peak:.2f})[/dim]")
+            # View of the recorded frames (no concatenation or copy)
+            audio_data = self.recorded_audio()
             
-            # Save to WAV file
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            audio_path = Path(f"/tmp/perplexity_audio_{timestamp}.wav")
+            # Normalize audio for better Whisper transcription (applied while encoding)
+            gain = normalization_gain(audio_data, verbose=True)
             
-            # Convert to int16 for WAV
-            audio_int16 = (audio_data * 32767).astype(np.int16)
-            
-            with wave.open(str(audio_path), 'wb') as wf:
-                wf.setnchannels(AUDIO_CHANNELS)
-                wf.setsampwidth(2)
-                wf.setframerate(AUDIO_SAMPLE_RATE)
-                wf.writeframes(audio_int16.tobytes())
+            # Encode in memory; both APIs upload straight from these bytes
+            wav_bytes = encode_wav(audio_data, gain)
             
             duration = len(audio_data) / AUDIO_SAMPLE_RATE
-            console.print(f"[green]✓ Audio saved:[/green] [dim]{audio_path}[/dim] [cyan]({duration:.1f} seconds)[/cyan]")
-            return str(audio_path)
+            if SAVE_AUDIO_FILES:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                audio_path = Path(f"/tmp/perplexity_audio_{timestamp}.wav")
+                audio_path.write_bytes(wav_bytes)
+                console.print(f"[green]✓ Audio saved:[/green] [dim]{audio_path}[/dim] [cyan]({duration:.1f} seconds)[/cyan]")
+            else:
+                console.print(f"[green]✓ Audio captured[/green] [cyan]({duration:.1f} seconds)[/cyan]")
+            return wav_bytes
             
         except Exception as e:
             console.print(f"[bold red]❌ Error stopping recording:[/bold red] {e}")
@@ -255,24 +413,42 @@ class AudioRecorder:
 
 # ============ SPEECH-TO-TEXT ============
 
-async def transcribe_audio_async(audio_path):
-    """Transcribe audio using OpenAI Whisper API (async)."""
+@functools.cache
+def _openai_client():
+    """Shared OpenAI client, so the HTTPS connection is kept alive across recordings."""
+    return OpenAI(api_key=OPENAI_API_KEY)
+
+
+def _transcribe_wav(wav_bytes):
+    """Blocking Whisper call for in-memory WAV bytes."""
+    transcript = _openai_client().audio.transcriptions.create(
+        model=OPENAI_STT_MODEL,
+        file=("audio.wav", io.BytesIO(wav_bytes), "audio/wav"),
+        language=TRANSCRIPTION_LANGUAGE,
+        response_format="text"
+    )
+    return transcript.strip()
+
+
+def transcribe_segment(audio_data, index):
+    """
+    Transcribe one segment cut while recording (blocking; runs on a worker thread).
+    
+    Returns the segment text ('' for silence) or None on failure.
+    """
+    try:
+        return _transcribe_wav(encode_wav(audio_data, normalization_gain(audio_data)))
+    except Exception as e:
+        console.print(f"[dim]⚠ Segment {index} transcription failed: {e}[/dim]")
+        return None
+
+
+async def transcribe_audio_async(wav_bytes):
+    """Transcribe WAV bytes using OpenAI Whisper API (async)."""
     try:
         # Run in thread pool since OpenAI client is synchronous
-        loop = asyncio.get_event_loop()
-        
-        def _transcribe():
-            client = OpenAI(api_key=OPENAI_API_KEY)
-            with open(audio_path, "rb") as audio_file:
-                transcript = client.audio.transcriptions.create(
-                    model=OPENAI_STT_MODEL,
-                    file=audio_file,
-                    language=TRANSCRIPTION_LANGUAGE,
-                    response_format="text"
-                )
-            return transcript.strip()
-        
-        transcript = await loop.run_in_executor(None, _transcribe)
+        loop = asyncio.get_running_loop()
+        transcript = await loop.run_in_executor(None, _transcribe_wav, wav_bytes)
         return transcript
         
     except Exception as e:
@@ -280,14 +456,24 @@ async def transcribe_audio_async(audio_path):
         return None
 
 
-def transcribe_audio(audio_path):
-    """Transcribe audio using OpenAI Whisper API (synchronous wrapper)."""
-    return asyncio.run(transcribe_audio_async(audio_path))
+# ============ EMOTION ANALYSIS ============
 
+# Hume batch job spec (prosody model only); constant, so serialize once
+_HUME_JOB_JSON = json.dumps({'models': {'prosody': {}}})
 
-# ============ EMOTION ANALYSIS ============
 
-async def analyze_emotion_async(audio_path):
+@functools.cache
+def _hume_session():
+    """Shared keep-alive session for Hume.ai (submit and polls reuse one connection)."""
+    # Import locally to keep module import cheap if emotion analysis is disabled.
+    import requests
+    
+    session = requests.Session()
+    session.headers['X-Hume-Api-Key'] = HUME_API_KEY
+    return session
+
+
+async def analyze_emotion_async(wav_bytes):
     """
     Analyze voice emotion using Hume.ai Prosody model (async).
     
@@ -308,47 +494,40 @@ async def analyze_emotion_async(audio_path):
     try:
         console.print("[dim]   🎭 Analyzing voice emotion...[/dim]")
         # Hume.ai API integration (run in thread pool since requests is synchronous)
-        import requests
-        loop = asyncio.get_event_loop()
+        session = _hume_session()
+        loop = asyncio.get_running_loop()
         
         def _submit_job():
-            with open(audio_path, 'rb') as audio_file:
-                files = {'file': audio_file}
-                json_data = {
-                    'models': {
-                        'prosody': {}
-                    }
-                }
-                
-                response = requests.post(
-                    'https://api.hume.ai/v0/batch/jobs',
-                    headers={'X-Hume-Api-Key': HUME_API_KEY},
-                    files=files,
-                    data={'json': str(json_data).replace("'", '"')}
-                )
-                
-                if response.status_code != 200:
-                    return None
-                
-                return response.json()['job_id']
+            # Own BytesIO so the upload cursor can't race the concurrent transcription
+            files = {'file': ('audio.wav', io.BytesIO(wav_bytes), 'audio/wav')}
+            
+            response = session.post(
+                'https://api.hume.ai/v0/batch/jobs',
+                files=files,
+                data={'json': _HUME_JOB_JSON}
+            )
+            
+            if response.status_code != 200:
+                return None
+            
+            return response.json()['job_id']
         
         def _poll_results(job_id):
-            max_wait = 10
-            for i in range(max_wait):
-                time.sleep(0.5)
-                
-                status_response = requests.get(
-                    f'https://api.hume.ai/v0/batch/jobs/{job_id}',
-                    headers={'X-Hume-Api-Key': HUME_API_KEY}
+            # Check right away, then back off: short clips often finish well
+            # under the old fixed 0.5s first sleep
+            deadline = time.monotonic() + HUME_POLL_TIMEOUT_S
+            delay = 0.1
+            while True:
+                status_response = session.get(
+                    f'https://api.hume.ai/v0/batch/jobs/{job_id}'
                 )
                 
                 if status_response.status_code == 200:
                     job_status = status_response.json()['state']['status']
                     
                     if job_status == 'COMPLETED':
-                        pred_response = requests.get(
-                            f'https://api.hume.ai/v0/batch/jobs/{job_id}/predictions',
-                            headers={'X-Hume-Api-Key': HUME_API_KEY}
+                        pred_response = session.get(
+                            f'https://api.hume.ai/v0/batch/jobs/{job_id}/predictions'
                         )
                         
                         if pred_response.status_code == 200:
@@ -451,8 +630,11 @@ async def analyze_emotion_async(audio_path):
                     
                     elif job_status == 'FAILED':
                         return None
-            
-            return None
+                
+                if time.monotonic() + delay > deadline:
+                    return None
+                time.sleep(delay)
+                delay = min(delay * 1.6, 1.0)
         
         # Submit job (blocking I/O, run in executor)
         job_id = await loop.run_in_executor(None, _submit_job)
@@ -476,9 +658,33 @@ async def analyze_emotion_async(audio_path):
         return None
 
 
-def analyze_emotion(audio_path):
-    """Analyze emotion (synchronous wrapper)."""
-    return asyncio.run(analyze_emotion_async(audio_path))
+async def _no_emotion():
+    """Placeholder for the emotion slot of the gather when analysis is disabled."""
+    return None
+
+
+# ============ CONNECTION WARM-UP ============
+
+def warm_up_connections():
+    """
+    Open the API connections ahead of the first recording (blocking; run in background).
+    
+    The first query otherwise pays DNS + TCP + TLS setup on the critical path. Uses
+    cheap unbilled requests on the shared client/session so the pooled connection
+    is already established when the first real upload happens.
+    """
+    try:
+        # Short timeout and no retries: a stalled warm-up must not hang around
+        # (with_options shares the client's connection pool, so it still warms it)
+        _openai_client().with_options(timeout=5, max_retries=0).models.list()
+    except Exception:
+        pass  # Warm-up is best effort; the real request will report errors
+    
+    if ENABLE_EMOTION_ANALYSIS and HUME_API_KEY and not HUME_API_KEY.startswith("your-"):
+        try:
+            _hume_session().head('https://api.hume.ai', timeout=5)
+        except Exception:
+            pass
 
 
 # ============ AUDIO PROCESSOR ============
@@ -493,27 +699,75 @@ class AudioProcessor:
     
     def __init__(self):
         self.recorder = AudioRecorder()
+        # One long-lived event loop for all processing, so each recording doesn't
+        # pay for a fresh loop and default executor (asyncio.run) on the hot path
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, name="audio-processor", daemon=True).start()
+        # Segments cut at pauses are transcribed here while recording continues
+        self._segment_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="stt-segment")
+        self._segment_futures = []
+        # Own thread, so a slow warm-up never holds a segment transcription worker
+        threading.Thread(target=warm_up_connections, name="api-warm-up", daemon=True).start()
     
     def start_recording(self, take_screenshot=False, window_id=None, app_name=None, window_bounds=None):
         """Start audio recording."""
+        self._segment_futures = []
+        self.recorder.on_segment = self._submit_segment if ENABLE_STREAMING_TRANSCRIPTION else None
         self.recorder.start_recording(take_screenshot, window_id, app_name, window_bounds)
     
+    def _submit_segment(self, audio_data):
+        """Queue a finished segment for background transcription (called from the audio thread)."""
+        index = len(self._segment_futures)
+        self._segment_futures.append(
+            self._segment_executor.submit(transcribe_segment, audio_data, index)
+        )
+    
+    async def _transcribe_streamed(self, wav_bytes):
+        """
+        Merge segment transcripts collected during recording with the uncut tail.
+        
+        Falls back to transcribing the whole recording if any segment failed.
+        """
+        futures = self._segment_futures
+        self._segment_futures = []
+        if not futures:
+            return await transcribe_audio_async(wav_bytes)
+        
+        recorder = self.recorder
+        tail = recorder.recorded_audio(recorder.segment_start)
+        if not recorder.tail_voiced:
+            pass  # Trailing silence only; Whisper tends to hallucinate text for it
+        elif len(tail) < TAIL_MIN_S * AUDIO_SAMPLE_RATE:
+            # Too short to transcribe on its own: redo the last segment with the tail
+            futures.pop().cancel()
+            merged = recorder.recorded_audio(recorder.prev_segment_start)
+            futures.append(self._segment_executor.submit(transcribe_segment, merged, len(futures)))
+        else:
+            futures.append(self._segment_executor.submit(transcribe_segment, tail, len(futures)))
+        
+        parts = await asyncio.gather(*(asyncio.wrap_future(f) for f in futures))
+        if any(part is None for part in parts):
+            console.print("[dim]   Segment transcription incomplete, transcribing full recording...[/dim]")
+            return await transcribe_audio_async(wav_bytes)
+        
+        console.print(f"[dim]   Merged {len(parts)} streamed segment(s)[/dim]")
+        return " ".join(part for part in parts if part)
+    
     async def stop_recording_and_process_async(self):
         """
         Stop recording and process audio (transcription + emotion analysis in parallel).
         
         Returns dict:
         {
-            'audio_path': '/tmp/...',
             'transcript': 'what is this error',
             'emotions': ['frustrated', 'confused'],  # or None
             'emotion_scores': {'frustrated': 0.8}    # or None
         }
         """
-        # Stop recording and get audio file
-        audio_path = self.recorder.stop_recording()
+        # Stop recording and get the encoded audio (kept in memory)
+        wav_bytes = self.recorder.stop_recording()
         
-        if not audio_path:
+        if not wav_bytes:
             return None
         
         # Show processing status
@@ -524,25 +778,21 @@ class AudioProcessor:
         ) as progress:
             task = progress.add_task("process", total=None)
             
-            # Run transcription and emotion analysis in parallel!
-            if ENABLE_EMOTION_ANALYSIS:
-                transcript, emotion_data = await asyncio.gather(
-                    transcribe_audio_async(audio_path),
-                    analyze_emotion_async(audio_path),
-                    return_exceptions=True  # Don't fail if one fails
-                )
-                
-                # Handle exceptions
-                if isinstance(transcript, Exception):
-                    console.print(f"[bold red]❌ Transcription error:[/bold red] {transcript}")
-                    transcript = None
-                
-                if isinstance(emotion_data, Exception):
-                    console.print(f"[yellow]⚠ Emotion analysis error:[/yellow] {emotion_data}")
-                    emotion_data = None
-            else:
-                # Only transcribe if emotion analysis disabled
-                transcript = await transcribe_audio_async(audio_path)
+            # Run transcription and emotion analysis in parallel on one event loop:
+            # wall time is max(whisper, hume) rather than the sum.
+            transcript, emotion_data = await asyncio.gather(
+                self._transcribe_streamed(wav_bytes),
+                analyze_emotion_async(wav_bytes) if ENABLE_EMOTION_ANALYSIS else _no_emotion(),
+                return_exceptions=True  # Don't fail if one fails
+            )
+
+            # Handle exceptions
+            if isinstance(transcript, Exception):
+                console.print(f"[bold red]❌ Transcription error:[/bold red] {transcript}")
+                transcript = None
+
+            if isinstance(emotion_data, Exception):
+                console.print(f"[yellow]⚠ Emotion analysis error:[/yellow] {emotion_data}")
                 emotion_data = None
         
         if not transcript:
@@ -551,7 +801,6 @@ class AudioProcessor:
         console.print(f"[green]✓ Transcription:[/green] [cyan]\"{transcript}\"[/cyan]")
         
         return {
-            'audio_path': audio_path,
             'transcript': transcript,
             'emotions': emotion_data['top_emotions'] if emotion_data else None,
             'emotion_scores': emotion_data['scores'] if emotion_data else None,
@@ -559,5 +808,7 @@ class AudioProcessor:
         }
     
     def stop_recording_and_process(self):
-        """Stop recording and process (synchronous wrapper for async method)."""
-        return asyncio.run(self.stop_recording_and_process_async())
\ No newline at end of file
+        """Stop recording and process on the processor's event loop (blocks until done)."""
+        return asyncio.run_coroutine_threadsafe(
+            self.stop_recording_and_process_async(), self._loop
+        ).result()
\ No newline at end of file
@@ -8,18 +8,29 @@ Python: 3.10+
 Platform: macOS
 """
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.common.exceptions import (
+    NoSuchWindowException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+import os
+import re
+import stat
 import sys
+import json
 import time
+import atexit
+import functools
+import itertools
+import threading
+import shutil
 import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
 from pynput import keyboard
+from PIL import Image, ImageFilter, ImageEnhance
 import socket
 from rich.console import Console
 from rich.panel import Panel
@@ -107,6 +118,12 @@ try:
     LOCAL_TTS_BLOCKING = bool(getattr(_cfg, "LOCAL_TTS_BLOCKING", False))
     PERPLEXITY_RESPONSE_WAIT_S = float(getattr(_cfg, "PERPLEXITY_RESPONSE_WAIT_S", 60.0) or 60.0)
     PERPLEXITY_RESPONSE_SETTLE_S = float(getattr(_cfg, "PERPLEXITY_RESPONSE_SETTLE_S", 1.0) or 1.0)
+
+    # Optional: screenshot upload encoding
+    SCREENSHOT_FORMAT = str(getattr(_cfg, "SCREENSHOT_FORMAT", "jpeg") or "jpeg").lower()
+    SCREENSHOT_QUALITY = int(getattr(_cfg, "SCREENSHOT_QUALITY", 92) or 92)
+    ENABLE_SHARPENING = bool(getattr(_cfg, "ENABLE_SHARPENING", True))
+    DEBUG_UPLOAD = bool(getattr(_cfg, "DEBUG_UPLOAD", False))
 except Exception:
     ENABLE_PROMPT_CLEANUP = False
     GROQ_API_KEY = ""
@@ -130,19 +147,78 @@ except Exception:
     PERPLEXITY_RESPONSE_WAIT_S = 60.0
     PERPLEXITY_RESPONSE_SETTLE_S = 1.0
 
+    SCREENSHOT_FORMAT = "jpeg"
+    SCREENSHOT_QUALITY = 92
+    ENABLE_SHARPENING = True
+    DEBUG_UPLOAD = False
+
 # Cache for Perplexity window handle (so we don't search every time)
 PERPLEXITY_WINDOW_HANDLE = None
 
 # Global region selector instance
 REGION_SELECTOR = None
 
+# Minimum spacing between drag updates in the pynput selection fallback
+MOUSE_MOVE_INTERVAL_S = 1 / 60
+
+# Resident overlay process shared by every RegionSelector (see overlay_process.py --daemon)
+OVERLAY_PROCESS = None
+_OVERLAY_SELECTION_IDS = itertools.count(1)
+
 
 # ============ REGION SELECTION WITH QT OVERLAY ============
+def get_overlay_process():
+    """Return the resident overlay process, starting it if needed (None if unavailable).
+    
+    Started once at launch so the Python + PySide6 import cost (~0.3-1 s) isn't
+    paid on every pedal press; each selection is then just a START/STOP message.
+    """
+    global OVERLAY_PROCESS
+    
+    if OVERLAY_PROCESS and OVERLAY_PROCESS.poll() is None:
+        return OVERLAY_PROCESS
+    
+    # Find overlay_process.py (same directory as this script)
+    overlay_script = Path(__file__).parent / "overlay_process.py"
+    if not overlay_script.exists():
+        console.print(f"   [yellow]⚠[/yellow] Overlay script not found: {overlay_script}")
+        return None
+    
+    try:
+        # Unbuffered binary pipes so select() on stdout sees every reply
+        OVERLAY_PROCESS = subprocess.Popen(
+            [sys.executable, str(overlay_script), "--daemon"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            bufsize=0,
+        )
+    except Exception as e:
+        console.print(f"   [yellow]⚠[/yellow] Could not start overlay: {e}")
+        OVERLAY_PROCESS = None
+    return OVERLAY_PROCESS
+
+
+def stop_overlay_process():
+    """Ask the resident overlay process to exit (called at shutdown)."""
+    global OVERLAY_PROCESS
+    
+    process, OVERLAY_PROCESS = OVERLAY_PROCESS, None
+    if not process or process.poll() is not None:
+        return
+    try:
+        process.stdin.write(b"QUIT\n")
+        process.stdin.close()
+        process.wait(timeout=1)
+    except (OSError, subprocess.TimeoutExpired):
+        process.kill()
+        process.wait()  # Reap zombie
+
+
 class RegionSelector:
     """
     Track mouse drag to select a screen region while recording.
-    Uses PySide6/Qt for visual overlay via subprocess (overlay_process.py).
-    Falls back to pynput-only if PySide6 not available.
+    Uses PySide6/Qt for visual overlay via the resident overlay subprocess
+    (overlay_process.py --daemon). Falls back to pynput-only if it can't be reached.
     """
     
     def __init__(self):
@@ -151,47 +227,34 @@ class RegionSelector:
         self.is_selecting = False
         self.selection_complete = False
         self._process = None
-        self._result_file = None
+        self._selection_id = None
     
     def __del__(self):
-        """Cleanup subprocess if RegionSelector is garbage collected."""
+        """Hide the overlay if RegionSelector is garbage collected."""
         self._cleanup_process()
         
     def start(self):
         """Start the overlay via subprocess."""
-        import tempfile
-        import os
-        
         self.start_point = None
         self.end_point = None
         self.is_selecting = False
         self.selection_complete = False
         
-        # Create temp file for result (using mkstemp for security)
-        fd, self._result_file = tempfile.mkstemp(suffix='.txt', prefix='region_')
-        os.close(fd)  # Close file descriptor, overlay will write to it
-        
-        # Find overlay_process.py (same directory as this script)
-        script_dir = Path(__file__).parent
-        overlay_script = script_dir / "overlay_process.py"
+        # Tags this selection's reply on the shared overlay pipe
+        self._selection_id = next(_OVERLAY_SELECTION_IDS)
         
-        if not overlay_script.exists():
-            console.print(f"   [yellow]⚠[/yellow] Overlay script not found: {overlay_script}")
+        process = get_overlay_process()
+        if process is None:
             self._start_pynput_fallback()
             return
         
-        # Run as subprocess - use pythonw if available for better GUI behavior
-        python_exe = sys.executable
-        
         try:
-            # Start subprocess - keep it simple, don't capture output so GUI can work
-            self._process = subprocess.Popen(
-                [python_exe, str(overlay_script), self._result_file]
-            )
+            process.stdin.write(f"START {self._selection_id}\n".encode())
+            self._process = process
             console.print("   [cyan]📐 REGION SELECT:[/cyan] [dim]Drag to select, ESC to cancel[/dim]")
             console.print("   [dim]📐 (Or just release pedal for window under cursor)[/dim]")
             
-        except Exception as e:
+        except OSError as e:
             console.print(f"   [yellow]⚠[/yellow] Could not start overlay: {e}")
             self._start_pynput_fallback()
     
@@ -217,57 +280,68 @@ class RegionSelector:
                     if region:
                         console.print(f"   [green]✓[/green] Region selected: {region[2]}x{region[3]} pixels")
         
+        # Only the last position matters (on_click records the final point),
+        # so sample drags at ~60 Hz rather than at the mouse's polling rate
+        last_move = [0.0]
+        
         def on_move(x, y):
-            if self.is_selecting:
-                self.end_point = (x, y)
+            if not self.is_selecting:
+                return
+            now = time.monotonic()
+            if now - last_move[0] < MOUSE_MOVE_INTERVAL_S:
+                return
+            last_move[0] = now
+            self.end_point = (x, y)
         
         self._mouse_listener = mouse.Listener(on_click=on_click, on_move=on_move)
         self._mouse_listener.start()
         console.print("   [dim]📐 (No visual overlay - using mouse tracking)[/dim]")
     
-    def _cleanup_process(self):
-        """Internal method to clean up subprocess."""
-        if self._process:
-            try:
-                # Check if process is still running
-                if self._process.poll() is None:
-                    # Process still running, try graceful termination
-                    self._process.terminate()
-                    try:
-                        self._process.wait(timeout=0.5)
-                    except subprocess.TimeoutExpired:
-                        # Force kill if terminate didn't work
-                        self._process.kill()
-                        self._process.wait()  # Reap zombie
-            except Exception:
-                pass  # Process already dead or other error
-            finally:
-                self._process = None
+    def _cleanup_process(self, timeout=0.0):
+        """Internal method to hide the overlay.
+        
+        Waits up to timeout for the overlay's reply and returns the selected
+        region as "x,y,w,h", or None if nothing was selected or no reply came.
+        """
+        import select
+        
+        process, self._process = self._process, None
+        if not process:
+            return None
+        try:
+            process.stdin.write(f"STOP {self._selection_id}\n".encode())
+            
+            # Reply is "DONE <id> [x,y,w,h]". Replies to earlier, timed-out
+            # selections may still be queued; skip them.
+            selection_id = str(self._selection_id).encode()
+            deadline = time.monotonic() + timeout
+            while (remaining := deadline - time.monotonic()) > 0:
+                ready, _, _ = select.select([process.stdout], [], [], remaining)
+                if not ready:
+                    break
+                line = process.stdout.readline()
+                if not line:
+                    break  # Overlay process exited
+                reply_id, _, region = line.strip().partition(b" ")[2].partition(b" ")
+                if reply_id == selection_id:
+                    return region.decode() or None
+        except (OSError, ValueError):
+            pass  # Overlay process died; it's restarted on next start()
+        return None
     
     def stop(self):
         """Stop the overlay and read result."""
-        import os
-        
-        # Clean up subprocess
-        self._cleanup_process()
-        
-        # Read result from file
-        if self._result_file:
+        # Hide the overlay and collect the region it reports
+        content = self._cleanup_process(timeout=0.5)
+        if content:
             try:
-                if os.path.exists(self._result_file):
-                    with open(self._result_file, 'r') as f:
-                        content = f.read().strip()
-                    if content:
-                        parts = content.split(',')
-                        if len(parts) == 4:
-                            x, y, w, h = map(int, parts)
-                            self.start_point = (x, y)
-                            self.end_point = (x + w, y + h)
-                            self.selection_complete = True
-                            console.print(f"   [green]✓[/green] Region: {w}x{h} at ({x}, {y})")
-                    os.unlink(self._result_file)
-            except (OSError, ValueError):
-                pass  # File I/O or parsing errors
+                x, y, w, h = map(int, content.split(','))
+                self.start_point = (x, y)
+                self.end_point = (x + w, y + h)
+                self.selection_complete = True
+                console.print(f"   [green]✓[/green] Region: {w}x{h} at ({x}, {y})")
+            except ValueError:
+                pass  # Malformed reply
         
         # Stop pynput listener if it was used
         if hasattr(self, '_mouse_listener'):
@@ -316,8 +390,9 @@ def check_microphone_permission():
     """Check if Microphone permission is granted by trying to list audio devices."""
     try:
         import sounddevice as sd
-        # Try to get the default input device - this will fail if no permission
-        devices = sd.query_devices()
+        # Try to get the default input device - this will fail if no permission.
+        # Query only the input device; a full query_devices() enumerates every
+        # CoreAudio device and its result was never used.
         default_input = sd.query_devices(kind='input')
         return default_input is not None
     except Exception:
@@ -378,8 +453,42 @@ def check_permissions():
 
 # ============ SCREENSHOT CAPTURE ============
 
+# Quartz symbols for window lookup and capture, imported once rather than per call
+try:
+    from Quartz import (
+        CGWindowListCopyWindowInfo,
+        kCGWindowListOptionOnScreenOnly,
+        kCGWindowListExcludeDesktopElements,
+        kCGNullWindowID,
+        CGEventCreate,
+        CGEventGetLocation,
+        CGWindowListCreateImage,
+        CGRectNull,
+        kCGWindowListOptionIncludingWindow,
+        kCGWindowImageBoundsIgnoreFraming,
+        CGImageGetWidth,
+        CGImageGetHeight,
+        CGImageGetBytesPerRow,
+        CGImageGetBitsPerPixel,
+        CGImageGetDataProvider,
+        CGDataProviderCopyData,
+    )
+except ImportError:
+    pass  # Without pyobjc the helpers below fail into their screencapture fallbacks
+
 # Apps to skip when looking for the topmost window
-SKIP_APPS = {'Terminal', 'iTerm2', 'iTerm', 'Code', 'Cursor', 'WindowServer', 'Dock'}
+SKIP_APPS = frozenset({'Terminal', 'iTerm2', 'iTerm', 'Code', 'Cursor', 'WindowServer', 'Dock'})
+
+# Reuse the last window lookup while the cursor stays put, so rapid re-triggers
+# on the same window skip CGWindowListCopyWindowInfo
+WINDOW_CACHE_TTL_S = 1.5
+WINDOW_CACHE_RADIUS_PX = 50
+_WINDOW_CACHE = {'time': 0.0, 'pos': None, 'result': None}
+
+
+def invalidate_window_cache():
+    """Forget the cached window lookup (e.g. after a capture of it failed)."""
+    _WINDOW_CACHE['result'] = None
 
 
 def get_window_under_mouse():
@@ -389,58 +498,49 @@ def get_window_under_mouse():
     Returns (window_id, app_name) or (None, None).
     """
     try:
-        from Quartz import (
-            CGWindowListCopyWindowInfo,
-            kCGWindowListOptionOnScreenOnly,
-            kCGWindowListExcludeDesktopElements,
-            kCGNullWindowID,
-            CGEventCreate,
-            CGEventGetLocation,
-        )
-        from AppKit import NSScreen
-        
         # Get current mouse position
         event = CGEventCreate(None)
         mouse_pos = CGEventGetLocation(event)
         mouse_x, mouse_y = mouse_pos.x, mouse_pos.y
         
-        # Get all screens (for reference)
-        screens = NSScreen.screens()
-        
         # Get all windows
         window_list = CGWindowListCopyWindowInfo(
             kCGWindowListOptionOnScreenOnly | kCGWindowListExcludeDesktopElements,
             kCGNullWindowID
         )
         
-        # Find the topmost window containing the mouse cursor
+        # Find the topmost window containing the mouse cursor.
+        # The list is already ordered front-to-back, so the first hit wins; the
+        # cheap layer/bounds tests run before anything else is read.
+        skip_apps = SKIP_APPS
         for window in window_list:
-            owner_name = window.get('kCGWindowOwnerName', '')
-            layer = window.get('kCGWindowLayer', -1)
-            bounds = window.get('kCGWindowBounds', {})
-            x = bounds.get('X', 0)
-            y = bounds.get('Y', 0)
-            width = bounds.get('Width', 0)
-            height = bounds.get('Height', 0)
-            window_id = window.get('kCGWindowNumber')
-            alpha = window.get('kCGWindowAlpha', 1.0)
-            
-            # Skip non-normal windows, tiny windows, transparent windows
-            if layer != 0:
+            # Skip non-normal windows
+            if window['kCGWindowLayer'] != 0:
                 continue
+            
+            bounds = window['kCGWindowBounds']
+            x = bounds['X']
+            y = bounds['Y']
+            width = bounds['Width']
+            height = bounds['Height']
+            
+            # Skip tiny windows and windows not under the mouse
             if width < 100 or height < 100:
                 continue
-            if alpha < 0.5:
+            if not (x <= mouse_x <= x + width and y <= mouse_y <= y + height):
                 continue
             
-            # Check if mouse is inside this window's bounds
-            if x <= mouse_x <= x + width and y <= mouse_y <= y + height:
-                # Skip Terminal/IDE if there's something else we could capture
-                if owner_name in SKIP_APPS:
-                    continue
-                    
-                console.print(f"   [green]✓[/green] SELECTED: {owner_name} (window {window_id})")
-                return window_id, owner_name, (x, y, width, height)
+            # Skip Terminal/IDE if there's something else we could capture
+            owner_name = window.get('kCGWindowOwnerName', '')
+            if owner_name in skip_apps:
+                continue
+            # Skip transparent windows
+            if window.get('kCGWindowAlpha', 1.0) < 0.5:
+                continue
+            
+            window_id = window['kCGWindowNumber']
+            console.print(f"   [green]✓[/green] SELECTED: {owner_name} (window {window_id})")
+            return window_id, owner_name, (x, y, width, height)
         
         console.print("   [yellow]⚠[/yellow] No window found under mouse cursor")
         return None, None, None
@@ -459,7 +559,33 @@ def get_frontmost_window_id():
     Falls back to scanning all windows front-to-back.
     Returns (window_id, app_name, bounds) or (None, None, None).
     bounds is (x, y, width, height) tuple.
+    
+    A hit is reused for WINDOW_CACHE_TTL_S as long as the cursor stays within
+    WINDOW_CACHE_RADIUS_PX of where it was looked up.
     """
+    try:
+        mouse_pos = CGEventGetLocation(CGEventCreate(None))
+        pos = (mouse_pos.x, mouse_pos.y)
+    except Exception:
+        pos = None
+    
+    cached = _WINDOW_CACHE['result']
+    if cached and pos and _WINDOW_CACHE['pos']:
+        dx = abs(pos[0] - _WINDOW_CACHE['pos'][0])
+        dy = abs(pos[1] - _WINDOW_CACHE['pos'][1])
+        if (time.monotonic() - _WINDOW_CACHE['time'] < WINDOW_CACHE_TTL_S
+                and dx + dy < WINDOW_CACHE_RADIUS_PX):
+            console.print(f"   [dim]Reusing window lookup: {cached[1]} (window {cached[0]})[/dim]")
+            return cached
+    
+    result = _find_frontmost_window()
+    if result[0] and pos:
+        _WINDOW_CACHE.update(time=time.monotonic(), pos=pos, result=result)
+    return result
+
+
+def _find_frontmost_window():
+    """Uncached lookup behind get_frontmost_window_id."""
     # First, try to get the window under the mouse cursor
     window_id, app_name, bounds = get_window_under_mouse()
     if window_id:
@@ -468,34 +594,27 @@ def get_frontmost_window_id():
     # Fallback: scan all windows front-to-back
     console.print("   [dim]Falling back to front-to-back scan...[/dim]")
     try:
-        from Quartz import (
-            CGWindowListCopyWindowInfo,
-            kCGWindowListOptionOnScreenOnly,
-            kCGWindowListExcludeDesktopElements,
-            kCGNullWindowID,
-        )
-        
         window_list = CGWindowListCopyWindowInfo(
             kCGWindowListOptionOnScreenOnly | kCGWindowListExcludeDesktopElements,
             kCGNullWindowID
         )
         
+        skip_apps = SKIP_APPS
         for window in window_list:
-            owner_name = window.get('kCGWindowOwnerName', '')
-            layer = window.get('kCGWindowLayer', -1)
-            win_bounds = window.get('kCGWindowBounds', {})
-            x = win_bounds.get('X', 0)
-            y = win_bounds.get('Y', 0)
-            width = win_bounds.get('Width', 0)
-            height = win_bounds.get('Height', 0)
-            window_id = window.get('kCGWindowNumber')
-            alpha = window.get('kCGWindowAlpha', 1.0)
-            
-            if layer != 0 or width < 200 or height < 200 or alpha < 0.5:
+            if window['kCGWindowLayer'] != 0:
                 continue
-            if owner_name in SKIP_APPS:
+            win_bounds = window['kCGWindowBounds']
+            width = win_bounds['Width']
+            height = win_bounds['Height']
+            if width < 200 or height < 200:
+                continue
+            owner_name = window.get('kCGWindowOwnerName', '')
+            if owner_name in skip_apps or window.get('kCGWindowAlpha', 1.0) < 0.5:
                 continue
             
+            x = win_bounds['X']
+            y = win_bounds['Y']
+            window_id = window['kCGWindowNumber']
             console.print(f"   [dim]Found: {owner_name} (window {window_id})[/dim]")
             return window_id, owner_name, (x, y, width, height)
         
@@ -507,33 +626,86 @@ def get_frontmost_window_id():
         return None, None, None
 
 
+# Lossy JPEG/WebP uploads are several times smaller than PNG for the same
+# Retina capture, and the upload is the slow part; PNG stays available
+SCREENSHOT_EXTENSION = {"png": "png", "webp": "webp"}.get(SCREENSHOT_FORMAT, "jpg")
+if SCREENSHOT_FORMAT not in ("png", "jpeg", "webp"):
+    SCREENSHOT_FORMAT = "jpeg"
+
+# Per-run scratch directory for screenshots, removed in one go on exit (a crashed
+# run's directory is swept at the next startup)
+TEMP_DIR_PREFIX = "macperplex_"
+TEMP_DIR = Path(tempfile.mkdtemp(prefix=TEMP_DIR_PREFIX, dir="/tmp"))
+atexit.register(shutil.rmtree, TEMP_DIR, ignore_errors=True)
+
+# Screenshots rotate through a small pool of fixed filenames instead of a new
+# timestamped name per capture; each is deleted after upload anyway
+SCREENSHOT_SLOTS = 4
+_SCREENSHOT_SLOT = itertools.cycle(range(SCREENSHOT_SLOTS))
+
+
+def next_screenshot_paths():
+    """Return (screenshot_path, temp_path) for the next slot, cleared of any leftover file."""
+    slot = next(_SCREENSHOT_SLOT)
+    # Recreate the scratch dir if macOS' periodic /tmp cleanup removed it
+    TEMP_DIR.mkdir(exist_ok=True)
+    screenshot_path = TEMP_DIR / f"perplexity_screenshot_{slot}.{SCREENSHOT_EXTENSION}"
+    # A capture left behind by a failed query must not pass for a fresh one
+    screenshot_path.unlink(missing_ok=True)
+    return screenshot_path, TEMP_DIR / f"perplexity_temp_{slot}.png"
+
+
+def file_size_or_zero(path):
+    """Size of path in bytes (one stat call), or 0 if it doesn't exist."""
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def sharpen_image(img):
+    """Apply unsharp mask and a slight contrast boost for better text readability."""
+    # Apply unsharp mask for better text clarity
+    # Parameters: radius, percent, threshold
+    img = img.filter(ImageFilter.UnsharpMask(radius=1.5, percent=120, threshold=2))
+    
+    # Slightly increase contrast to make text pop
+    enhancer = ImageEnhance.Contrast(img)
+    return enhancer.enhance(1.05)
+
+
+def save_screenshot(img, output_path):
+    """Save in the configured upload format (SCREENSHOT_FORMAT)."""
+    if SCREENSHOT_FORMAT == "png":
+        # Fast zlib level: the file is uploaded once and deleted, so
+        # optimize=True's max-effort compression is wasted CPU.
+        img.save(output_path, 'PNG', compress_level=1)
+        return
+    if img.mode not in ("RGB", "L"):
+        img = img.convert("RGB")  # JPEG has no alpha channel
+    img.save(output_path, SCREENSHOT_FORMAT.upper(), quality=SCREENSHOT_QUALITY)
+
+
 def sharpen_image_and_save(input_path, output_path):
-    """Apply sharpening and save as lossless PNG for better text readability."""
+    """Apply sharpening and save in the upload format for better text readability."""
     try:
-        from PIL import Image, ImageFilter, ImageEnhance
+        if not ENABLE_SHARPENING and SCREENSHOT_FORMAT == "png":
+            # Input is already the PNG we'd write: move it into place, no decode
+            Path(input_path).replace(output_path)
+            return True
         
         img = Image.open(input_path)
-        
-        # Apply unsharp mask for better text clarity
-        # Parameters: radius, percent, threshold
-        img = img.filter(ImageFilter.UnsharpMask(radius=1.5, percent=120, threshold=2))
-        
-        # Slightly increase contrast to make text pop
-        enhancer = ImageEnhance.Contrast(img)
-        img = enhancer.enhance(1.05)
-        
-        # Save as lossless PNG
-        img.save(output_path, 'PNG', optimize=True)
-        console.print(f"   [green]✓[/green] Sharpened and saved as lossless PNG")
+        save_screenshot(sharpen_image(img) if ENABLE_SHARPENING else img, output_path)
         return True
     except Exception as e:
         console.print(f"   [yellow]⚠[/yellow] Sharpening failed: {e}")
-        # Fallback: just copy the file
+        # Fallback: save it unsharpened, still in the upload format (a plain copy
+        # would put PNG bytes under a .jpg/.webp name)
         try:
-            import shutil
-            shutil.copy(input_path, output_path)
+            with Image.open(input_path) as img:
+                save_screenshot(img, output_path)
             return True
-        except (OSError, IOError):
+        except (OSError, ValueError):
             return False
 
 
@@ -561,15 +733,19 @@ def capture_region_screenshot(region, screenshot_path):
             timeout=5
         )
         
-        if result.returncode == 0 and temp_png.exists() and temp_png.stat().st_size > 1000:
+        if result.returncode == 0 and file_size_or_zero(temp_png) > 1000:
             # Apply sharpening and save
             if sharpen_image_and_save(temp_png, screenshot_path):
                 temp_png.unlink(missing_ok=True)
                 return True
-            else:
-                # Fallback: just rename
+            elif SCREENSHOT_FORMAT == "png":
+                # Fallback: the raw capture is already a PNG, just rename
                 temp_png.rename(screenshot_path)
                 return True
+            else:
+                # Can't be re-encoded to the upload format; let the window fallback run
+                temp_png.unlink(missing_ok=True)
+                return False
         else:
             if result.stderr:
                 print(f"   ⚠ Region capture failed: {result.stderr.decode().strip()}")
@@ -583,16 +759,6 @@ def capture_region_screenshot(region, screenshot_path):
 def capture_window_with_quartz(window_id, screenshot_path):
     """Capture a window using CGWindowListCreateImage (works better on multi-monitor)."""
     try:
-        from Quartz import (
-            CGWindowListCreateImage,
-            CGRectNull,
-            kCGWindowListOptionIncludingWindow,
-            kCGWindowImageBoundsIgnoreFraming,
-        )
-        from Quartz import CGImageDestinationCreateWithURL, CGImageDestinationAddImage, CGImageDestinationFinalize
-        from CoreFoundation import CFURLCreateFromFileSystemRepresentation, kCFAllocatorDefault
-        import os
-        
         # Capture the specific window at FULL Retina resolution (no kCGWindowImageNominalResolution)
         # This gives us 2x pixels on Retina displays for better text clarity
         image = CGWindowListCreateImage(
@@ -606,49 +772,28 @@ def capture_window_with_quartz(window_id, screenshot_path):
             print(f"   ⚠ CGWindowListCreateImage returned None")
             return False
         
-        # Save as PNG (lossless) - first to temp file for sharpening
-        temp_png_path = str(screenshot_path) + '.temp'
-        url = CFURLCreateFromFileSystemRepresentation(
-            kCFAllocatorDefault,
-            temp_png_path.encode('utf-8'),
-            len(temp_png_path),
-            False
-        )
-        
-        # Create PNG destination (use string UTI - constants moved in newer macOS)
-        destination = CGImageDestinationCreateWithURL(url, 'public.png', 1, None)
-        if destination is None:
-            print(f"   ⚠ Could not create image destination")
+        # Read the pixels straight out of the CGImage instead of round-tripping
+        # through a temp PNG (saves one encode and one decode per capture).
+        # Window images are 32-bit little-endian premultiplied-first, i.e. BGRA in memory.
+        if CGImageGetBitsPerPixel(image) != 32:
+            print(f"   ⚠ Unexpected pixel format ({CGImageGetBitsPerPixel(image)} bpp)")
             return False
         
-        CGImageDestinationAddImage(destination, image, None)
+        width = CGImageGetWidth(image)
+        height = CGImageGetHeight(image)
+        pixels = CGDataProviderCopyData(CGImageGetDataProvider(image))
+        img = Image.frombuffer(
+            'RGBA', (width, height), pixels, 'raw', 'BGRA', CGImageGetBytesPerRow(image), 1
+        ).convert('RGB')
         
-        if not CGImageDestinationFinalize(destination):
-            print(f"   ⚠ Failed to finalize image")
-            return False
-        
-        # Apply sharpening and save as PNG (lossless)
+        # Apply sharpening and save
         try:
-            from PIL import Image, ImageFilter, ImageEnhance
-            img = Image.open(temp_png_path)
-            
-            # Apply sharpening for better text clarity
-            img = img.filter(ImageFilter.UnsharpMask(radius=1.5, percent=120, threshold=2))
-            enhancer = ImageEnhance.Contrast(img)
-            img = enhancer.enhance(1.05)
-            
-            # Save as PNG (lossless)
-            img.save(screenshot_path, 'PNG', optimize=True)
-            
-            # Clean up temp file
-            os.unlink(temp_png_path)
-            print(f"   ✓ Captured at Retina resolution, sharpened, saved as lossless PNG")
-            return True
+            if ENABLE_SHARPENING:
+                img = sharpen_image(img)
         except Exception as e:
-            # If PIL fails, just rename the temp file
             print(f"   ⚠ Sharpening failed ({e}), using raw capture")
-            os.rename(temp_png_path, str(screenshot_path))
-            return True
+        save_screenshot(img, screenshot_path)
+        return True
             
     except Exception as e:
         print(f"   ⚠ Quartz capture error: {e}")
@@ -657,127 +802,62 @@ def capture_window_with_quartz(window_id, screenshot_path):
 
 def capture_screenshot_func(target_window_id=None, target_app_name=None, window_bounds=None):
     """Capture a specific window by ID or bounds, or fall back to full screen."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Use /tmp for temporary screenshots
+    screenshot_path, temp_png = next_screenshot_paths()
     
-    # Use /tmp for temporary screenshots (PNG for lossless quality)
-    screenshot_path = Path(f"/tmp/perplexity_screenshot_{timestamp}.png")
+    def captured_ok():
+        return file_size_or_zero(screenshot_path) > 1000
     
     try:
         window_captured = False
         
-        # If we have a pre-captured window ID, try to capture it
+        # If we have a pre-captured window ID, try to capture it in-process
         if target_window_id:
-            print(f"   Capturing window ID {target_window_id} ({target_app_name or 'unknown app'})...")
-            
-            # First try: CGWindowListCreateImage (most reliable for specific windows)
-            print(f"   Trying Quartz/CGWindowListCreateImage...")
-            if capture_window_with_quartz(target_window_id, screenshot_path):
-                if screenshot_path.exists() and screenshot_path.stat().st_size > 1000:
-                    console.print(f"[green]✓ Captured window via Quartz:[/green] {target_app_name or 'unknown'}")
-                    window_captured = True
-            
-            # Second try: screencapture -l (window ID)
-            if not window_captured:
-                print(f"   Trying screencapture -l...")
-                temp_png = Path(f"/tmp/perplexity_temp_{timestamp}.png")
-                result = subprocess.run(
-                    ["screencapture", "-x", "-o", "-l", str(target_window_id), "-t", "png", str(temp_png)],
-                    capture_output=True,
-                    timeout=5
-                )
-                
-                if result.returncode == 0 and temp_png.exists() and temp_png.stat().st_size > 1000:
-                    # Convert to sharpened JPEG
-                    if sharpen_image_and_save(temp_png, screenshot_path):
-                        console.print(f"[green]✓ Captured window:[/green] {target_app_name or 'unknown'}")
-                        window_captured = True
-                    temp_png.unlink(missing_ok=True)
-                else:
-                    if result.stderr:
-                        print(f"   ⚠ screencapture -l failed: {result.stderr.decode().strip()}")
+            if capture_window_with_quartz(target_window_id, screenshot_path) and captured_ok():
+                window_captured = True
+            else:
+                invalidate_window_cache()
         
         # If no target window ID or capture failed, try to get current topmost window
         if not window_captured:
             print("   Retrying with current topmost window...")
-            window_id, app_name = get_frontmost_window_id()
+            window_id, app_name, _ = get_frontmost_window_id()
             
-            if window_id:
-                temp_png = Path(f"/tmp/perplexity_temp2_{timestamp}.png")
-                result = subprocess.run(
-                    ["screencapture", "-x", "-o", "-l", str(window_id), "-t", "png", str(temp_png)],
-                    capture_output=True,
-                    timeout=5
-                )
-                
-                if result.returncode == 0 and temp_png.exists() and temp_png.stat().st_size > 1000:
-                    if sharpen_image_and_save(temp_png, screenshot_path):
-                        console.print(f"[green]✓ Captured:[/green] {app_name}")
-                        window_captured = True
-                    temp_png.unlink(missing_ok=True)
+            if window_id and window_id != target_window_id:
+                if capture_window_with_quartz(window_id, screenshot_path) and captured_ok():
+                    console.print(f"[green]✓ Captured:[/green] {app_name}")
+                    window_captured = True
         
-        # If window capture didn't work, fall back to full screen
+        # Last resort: one full-screen screencapture. (screencapture -l goes
+        # through the same window server path that just failed for Quartz.)
         if not window_captured:
             print(f"   📸 Falling back to full screen capture...")
-            
-            # Fallback to full screen
-            temp_png = Path(f"/tmp/perplexity_temp3_{timestamp}.png")
             result = subprocess.run(
                 ["screencapture", "-x", "-t", "png", str(temp_png)],
                 capture_output=True,
                 timeout=5
             )
-            
             if result.returncode == 0 and temp_png.exists():
                 sharpen_image_and_save(temp_png, screenshot_path)
-                temp_png.unlink(missing_ok=True)
+            elif result.stderr:
+                print(f"   ⚠ screencapture failed: {result.stderr.decode().strip()}")
+            temp_png.unlink(missing_ok=True)
         
-        # Verify file exists and has content
-        if not screenshot_path.exists():
-            console.print("[red]✗ Screenshot file was not created[/red]")
-            return None
-        
-        file_size = screenshot_path.stat().st_size
+        # Verify file exists and has content (0 if it was never created)
+        file_size = file_size_or_zero(screenshot_path)
         if file_size < 1000:  # Less than 1KB is definitely wrong
-            console.print(f"[red]✗ Screenshot file too small:[/red] {file_size} bytes")
-            screenshot_path.unlink()
+            console.print(f"[red]✗ Screenshot missing or too small:[/red] {file_size} bytes")
+            screenshot_path.unlink(missing_ok=True)
             return None
         
-        # Get image dimensions using sips (built-in macOS tool)
+        # One summary line; dimensions come from the file header (no need to spawn sips)
         try:
-            sips_result = subprocess.run(
-                ["sips", "-g", "pixelWidth", "-g", "pixelHeight", str(screenshot_path)],
-                capture_output=True,
-                text=True,
-                timeout=3
-            )
-            if sips_result.returncode == 0:
-                lines = sips_result.stdout.split('\n')
-                width = height = None
-                for line in lines:
-                    if 'pixelWidth:' in line:
-                        width = line.split(':')[1].strip()
-                    elif 'pixelHeight:' in line:
-                        height = line.split(':')[1].strip()
-                
-                if width and height:
-                    print(f"  Dimensions: {width} x {height} pixels")
-                    
-                    # Calculate megapixels
-                    try:
-                        w = int(width)
-                        h = int(height)
-                        total_pixels = w * h
-                        megapixels = total_pixels / 1_000_000
-                        print(f"  Resolution: {megapixels:.2f} megapixels")
-                    except (ValueError, TypeError):
-                        pass  # Parsing errors
-        except (subprocess.SubprocessError, OSError):
-            pass  # sips command failures
-        
-        # Convert to MB for display
+            with Image.open(screenshot_path) as img:
+                dimensions = "{} x {}, ".format(*img.size)
+        except OSError:
+            dimensions = ""  # Dimensions are informational only
         size_mb = file_size / (1024 * 1024)
-        console.print(f"[green]✓ Captured screenshot:[/green] [dim]{screenshot_path}[/dim]")
-        console.print(f"[dim]  File size: {size_mb:.2f} MB ({file_size:,} bytes)[/dim]")
+        console.print(f"[green]✓ Captured screenshot:[/green] {dimensions}{size_mb:.2f} MB [dim]{screenshot_path}[/dim]")
         
         return str(screenshot_path)
             
@@ -788,13 +868,406 @@ def capture_screenshot_func(target_window_id=None, target_app_name=None, window_
         console.print(f"[red]✗ Screenshot capture failed:[/red] {e}")
         return None
 
+
+# Single worker: one screenshot per pedal release
+SCREENSHOT_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="screenshot")
+
+
+def capture_release_screenshot(region, window_id, app_name, bounds):
+    """Capture the selected region, or the fallback window if there is none.
+    
+    Runs on SCREENSHOT_EXECUTOR while the recording is transcribed.
+    Returns the screenshot path or None.
+    """
+    screenshot_path = None
+    
+    if region:
+        # User selected a region - capture it
+        console.print("[cyan]📸 Capturing selected region...[/cyan]")
+        screenshot_path, _ = next_screenshot_paths()
+        
+        if capture_region_screenshot(region, screenshot_path):
+            console.print(f"[green]✓ Captured region:[/green] {region[2]} x {region[3]} [dim]{screenshot_path}[/dim]")
+        else:
+            console.print("[yellow]⚠ Region capture failed, trying window fallback...[/yellow]")
+            screenshot_path = None
+    
+    # No region selected or region capture failed - use window fallback
+    if not screenshot_path:
+        console.print(f"[cyan]📸 Capturing window:[/cyan] {app_name or 'unknown'}...")
+        screenshot_path = capture_screenshot_func(window_id, app_name, bounds)
+        if not screenshot_path:
+            console.print("[yellow]⚠ Screenshot capture failed[/yellow]")
+    
+    return screenshot_path
+
+
 # ============ MAIN PROCESSING FUNCTION ============
-def send_to_perplexity(driver, wait, result, screenshot_path=None):
+
+# Upper bound on waiting for Chrome to become the frontmost app after activation
+CHROME_ACTIVATE_TIMEOUT_S = 2.0
+
+# Short in-page state waits: upper bound and poll interval (Selenium defaults to 0.5 s)
+UI_WAIT_TIMEOUT_S = 2.0
+UI_POLL_S = 0.05
+
+
+def chrome_is_frontmost():
+    """True if Chrome owns the frontmost normal window; None if Quartz can't tell."""
+    try:
+        window_list = CGWindowListCopyWindowInfo(
+            kCGWindowListOptionOnScreenOnly | kCGWindowListExcludeDesktopElements,
+            kCGNullWindowID
+        )
+        front = next((w for w in window_list if w['kCGWindowLayer'] == 0), None)
+        return front is not None and front.get('kCGWindowOwnerName') == "Google Chrome"
+    except Exception:
+        return None
+
+
+def start_chrome_activation():
+    """Start bringing Chrome to the front; returns the osascript process, or None.
+    
+    Skips the osascript fork entirely when Chrome is already frontmost.
+    """
+    if chrome_is_frontmost():
+        return None
+    try:
+        return subprocess.Popen(
+            ["osascript", "-e", 'tell application "Google Chrome" to activate'],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    except OSError as e:
+        console.print(f"   [yellow]⚠[/yellow] Could not activate Chrome window: {e}")
+        return None
+
+
+def wait_for_chrome_front(process, timeout=CHROME_ACTIVATE_TIMEOUT_S):
+    """Wait until Chrome owns the frontmost normal window, polling every 50 ms.
+    
+    Replaces a fixed sleep after activation: usually returns as soon as the
+    window is forward. Returns False if Chrome isn't frontmost by the deadline.
+    """
+    deadline = time.monotonic() + timeout
+    if process:
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()  # Reap zombie
+    
+    while True:
+        front = chrome_is_frontmost()
+        if front is None:
+            time.sleep(0.5)  # Can't check: fall back to a fixed settle time
+            return True
+        if front:
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.05)
+
+
+# Perplexity page locators, built once instead of per query. CSS rather than
+# XPath: Chromium matches CSS selectors natively and faster.
+# (Value of selenium's By.CSS_SELECTOR; selenium.webdriver is imported only after
+# the Chrome debug check, see CONNECT TO CHROME.)
+CSS_SELECTOR = "css selector"
+CHAT_INPUT_LOCATOR = (CSS_SELECTOR, "div[contenteditable='true'][role='textbox']")
+REMOVE_UPLOAD_LOCATOR = (CSS_SELECTOR, "button[data-testid='remove-uploaded-file']")
+SUBMIT_BUTTON_LOCATOR = (CSS_SELECTOR, "button[aria-label='Submit']")
+# Replaces the submit button while an answer is being generated
+STOP_BUTTON_LOCATOR = (CSS_SELECTOR, "button[aria-label='Stop']")
+# Broad fallback: any sign that an attachment preview is showing
+UPLOAD_INDICATOR_LOCATOR = (
+    CSS_SELECTOR,
+    "img[src*='blob:'], div[class*='preview'], button[aria-label*='Remove']",
+)
+
+HAS_FOCUS_JS = "return arguments[0].contains(document.activeElement);"
+
+# Clears every file input and returns the first one with its attributes (null if none)
+PREPARE_FILE_INPUTS_JS = """
+const inputs = document.querySelectorAll("input[type='file']");
+inputs.forEach(x => { x.value = ''; });
+const first = inputs[0];
+return first ? {input: first, count: inputs.length, multiple: first.multiple, accept: first.accept} : null;
+"""
+
+# File count plus name/size of the first file in a file input
+FILE_INPUT_INFO_JS = """
+const files = arguments[0].files;
+return {count: files.length, name: files[0] ? files[0].name : null, size: files[0] ? files[0].size : null};
+"""
+
+# Selector variants for the Search/Research segmented control
+# (Perplexity UI sometimes changes role/structure)
+_MODE_BUTTON_XPATHS = (
+    "//button[@aria-label='{label}' and @role='radio']",
+    "//button[@aria-label='{label}']",
+    "//div[@role='radiogroup']//button[@aria-label='{label}']",
+    "//div[@role='radiogroup']//button[normalize-space()='{label}']",
+    "//button[normalize-space()='{label}']",
+)
+SEARCH_BUTTON_XPATHS = [xp.format(label="Search") for xp in _MODE_BUTTON_XPATHS]
+RESEARCH_BUTTON_XPATHS = [xp.format(label="Research") for xp in _MODE_BUTTON_XPATHS] + [
+    # Last resort: any button whose aria-label contains "research" (case-insensitive)
+    "//button[contains(translate(@aria-label,"
+    " 'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'), 'research')]",
+]
+
+# Spoken keyword that switches a query to Deep Research mode
+RESEARCH_KEYWORD_RE = re.compile(r"research", re.IGNORECASE)
+
+# Evaluates every selector variant in the page and returns the first visible match
+# for each group, instead of one find_elements + is_displayed round-trip per candidate.
+FIND_MODE_BUTTONS_JS = """
+function firstVisible(xpaths) {
+    for (const xp of xpaths) {
+        const snap = document.evaluate(xp, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (let i = 0; i < snap.snapshotLength; i++) {
+            const el = snap.snapshotItem(i);
+            if ((el.offsetWidth || el.offsetHeight || el.getClientRects().length)
+                    && getComputedStyle(el).visibility !== 'hidden') {
+                return el;
+            }
+        }
+    }
+    return null;
+}
+return [firstVisible(arguments[0]), firstVisible(arguments[1])];
+"""
+
+# Segmented-control state: Radix sets data-state, plain ARIA radios set aria-checked
+IS_CHECKED_JS = """
+const el = arguments[0];
+return (el.getAttribute('data-state') || '').toLowerCase() === 'checked'
+    || (el.getAttribute('aria-checked') || '').toLowerCase() === 'true';
+"""
+
+
+def build_message(result):
+    """Build the prompt text for a processed recording.
+    
+    Applies the optional Groq cleanup, prepends the emotion context and appends
+    the response format hint. Runs on MESSAGE_EXECUTOR so the Groq round-trip
+    overlaps finding the Perplexity tab.
+    """
+    raw_transcript = result['transcript']
+    message_text = raw_transcript
+    emotions = result.get('emotions')
+    emotion_scores = result.get('emotion_scores')
+
+    # Optional: cleanup transcript via Groq before sending
+    if ENABLE_PROMPT_CLEANUP:
+        def _looks_like_question(s: str) -> bool:
+            s = (s or "").strip()
+            if not s:
+                return False
+            if s.endswith("?"):
+                return True
+            low = s.lower()
+            # Common spoken question openers (STT sometimes drops '?')
+            return low.startswith(
+                (
+                    "can you",
+                    "could you",
+                    "would you",
+                    "will you",
+                    "what ",
+                    "why ",
+                    "how ",
+                    "when ",
+                    "where ",
+                    "who ",
+                    "is ",
+                    "are ",
+                    "do ",
+                    "does ",
+                    "did ",
+                    "should ",
+                    "can ",
+                    "could ",
+                    "would ",
+                    "will ",
+                )
+            )
+
+        def _keyword_recall_ok(raw: str, cleaned: str) -> bool:
+            """
+            Heuristic guardrail against cleanup that drops important context.
+            We compute a simple keyword recall over non-trivial tokens.
+            """
+            def tokens(s: str) -> set[str]:
+                s = (s or "").lower()
+                # Keep words/numbers/identifiers (including underscores/slashes/dashes)
+                parts = re.findall(r"[a-z0-9_./-]+", s)
+                stop = {
+                    "the",
+                    "and",
+                    "that",
+                    "this",
+                    "with",
+                    "from",
+                    "have",
+                    "has",
+                    "had",
+                    "what",
+                    "when",
+                    "where",
+                    "which",
+                    "who",
+                    "whom",
+                    "why",
+                    "how",
+                    "can",
+                    "could",
+                    "would",
+                    "should",
+                    "will",
+                    "do",
+                    "does",
+                    "did",
+                    "a",
+                    "an",
+                    "to",
+                    "of",
+                    "in",
+                    "on",
+                    "for",
+                    "at",
+                    "it",
+                    "is",
+                    "are",
+                    "was",
+                    "were",
+                    "be",
+                    "been",
+                    "being",
+                    "i",
+                    "me",
+                    "my",
+                    "we",
+                    "our",
+                    "you",
+                    "your",
+                    "they",
+                    "their",
+                    "them",
+                }
+                # Keep "contentful" tokens: length>3 OR contains digit/symbol (e.g. ubuntu, smartctl, /dev/sda)
+                out = set()
+                for p in parts:
+                    if p in stop:
+                        continue
+                    if len(p) > 3 or any(ch.isdigit() for ch in p) or any(ch in p for ch in ("_", "/", "-", ".")):
+                        out.add(p)
+                return out
+
+            raw_set = tokens(raw)
+            if not raw_set:
+                return True
+            cleaned_set = tokens(cleaned)
+            recall = len(raw_set & cleaned_set) / max(1, len(raw_set))
+            return recall >= 0.70
+
+        if not GROQ_API_KEY or GROQ_API_KEY.startswith("your-"):
+            console.print("[yellow]⚠ Prompt cleanup enabled, but GROQ_API_KEY is not set. Sending raw transcript.[/yellow]")
+        elif not cleanup_prompt_via_groq or not CleanupConfig:
+            console.print("[yellow]⚠ Prompt cleanup module unavailable. Sending raw transcript.[/yellow]")
+        else:
+            console.print("[cyan]🧹 Cleaning up transcript (Groq)...[/cyan]")
+            cleaned = cleanup_prompt_via_groq(
+                raw_transcript,
+                CleanupConfig(
+                    api_key=GROQ_API_KEY,
+                    base_url=GROQ_BASE_URL,
+                    model=GROQ_CLEANUP_MODEL,
+                    timeout_s=GROQ_TIMEOUT_S,
+                ),
+            )
+            if cleaned and cleaned.strip():
+                # Safety: if the raw transcript is a question, do not allow cleanup to
+                # turn it into a declarative/advice statement.
+                raw_is_q = _looks_like_question(raw_transcript)
+                cleaned_is_q = _looks_like_question(cleaned)
+                length_ratio = (len(cleaned.strip()) / max(1, len(raw_transcript.strip()))) if raw_transcript else 1.0
+                recall_ok = _keyword_recall_ok(raw_transcript, cleaned)
+
+                if raw_is_q and not cleaned_is_q:
+                    console.print("[yellow]⚠ Prompt cleanup changed a question into a statement. Sending raw transcript.[/yellow]")
+                    console.print(f"[dim]   Raw:     {raw_transcript}[/dim]")
+                    console.print(f"[dim]   Cleaned:  {cleaned}[/dim]")
+                elif length_ratio < 0.60 or not recall_ok:
+                    console.print("[yellow]⚠ Prompt cleanup removed too much context. Sending raw transcript.[/yellow]")
+                    console.print(f"[dim]   Raw:     {raw_transcript}[/dim]")
+                    console.print(f"[dim]   Cleaned:  {cleaned}[/dim]")
+                else:
+                    message_text = cleaned
+                    if message_text != raw_transcript:
+                        console.print("[green]✓[/green] Transcript cleaned")
+                        console.print(f"[dim]   Before: {raw_transcript}[/dim]")
+                        console.print(f"[dim]   After:  {message_text}[/dim]")
+            else:
+                console.print("[yellow]⚠ Prompt cleanup failed/timeout. Sending raw transcript.[/yellow]")
+    
+    # Add emotion context to message if emotions detected (structured JSON format)
+    if emotions and emotion_scores and ENABLE_EMOTION_ANALYSIS:
+        # Structured emotion metadata with scores nested, plus any extra metadata fields
+        emotion_data = {
+            'source': 'hume_prosody',
+            'scores': emotion_scores,
+            **(result.get('emotion_metadata') or {}),
+        }
+        emotion_json = json.dumps(emotion_data, separators=(',', ':'))
+        message_with_context = f"[voice_affect: {emotion_json}] {message_text}"
+        
+        emotions_display = ', '.join(f"{e}({emotion_scores[e]:.2f})" for e in emotions)
+        console.print(f"[magenta]🎭 Adding emotion context:[/magenta] [dim]{emotions_display}[/dim]")
+        console.print(f"[dim]   Full message to send: {message_with_context[:100]}...[/dim]")
+    else:
+        message_with_context = message_text
+        console.print(f"[dim]   No emotion context (emotions={emotions}, scores={emotion_scores}, enabled={ENABLE_EMOTION_ANALYSIS})[/dim]")
+
+    # Optional: append response formatting hint (avoid newlines to prevent accidental submits)
+    append_text_source = RESPONSE_FORMAT_APPEND_TEXT
+    if ENABLE_TLDR_MARKERS and TLDRFormatConfig:
+        try:
+            append_text_source = TLDRFormatConfig(
+                tldr_marker=TLDR_MARKER,
+                full_marker=FULL_MARKER,
+                end_marker=END_MARKER,
+                tldr_sentences=TLDR_SENTENCES,
+            ).build_append_hint()
+        except Exception:
+            append_text_source = RESPONSE_FORMAT_APPEND_TEXT
+
+    if ENABLE_RESPONSE_FORMAT_HINT and append_text_source:
+        append_text = " ".join(str(append_text_source).strip().split())
+        if append_text:
+            joiner = " " if not message_with_context.endswith((" ", "\t")) else ""
+            message_with_context = f"{message_with_context}{joiner}{append_text}"
+            if ENABLE_TLDR_MARKERS:
+                console.print("[dim]   🧾 Appended TL;DR marker format hint[/dim]")
+            else:
+                console.print("[dim]   🧾 Appended response format hint (TL;DR + full answer)[/dim]")
+
+    return message_with_context
+
+
+# Builds the prompt (incl. Groq cleanup) while send_to_perplexity finds the tab
+MESSAGE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="message")
+
+
+def send_to_perplexity(driver, wait, result, screenshot_path=None, screenshot_future=None):
     """Send transcribed audio and optional screenshot to Perplexity with emotion context.
     
     Args:
         result: Dict from AudioProcessor with transcript, emotions, etc.
         screenshot_path: Optional path to screenshot
+        screenshot_future: Optional pending capture (resolves to a path or None);
+            awaited before the browser is touched, so it never shows Chrome
     """
     
     try:
@@ -806,230 +1279,31 @@ def send_to_perplexity(driver, wait, result, screenshot_path=None):
             console.print("[bold red]❌ No audio data, aborting...[/bold red]")
             return
         
-        # Step 1: Get transcript and emotion data from result
+        # Step 1: Build the message (transcript cleanup + emotion context) in the
+        # background; it is only needed once we're ready to type in Step 6
         raw_transcript = result['transcript']
-        message_text = raw_transcript
-        emotions = result.get('emotions')
-        emotion_scores = result.get('emotion_scores')
-        audio_path = result.get('audio_path')
-
-        # Optional: cleanup transcript via Groq before sending
-        if ENABLE_PROMPT_CLEANUP:
-            def _looks_like_question(s: str) -> bool:
-                s = (s or "").strip()
-                if not s:
-                    return False
-                if s.endswith("?"):
-                    return True
-                low = s.lower()
-                # Common spoken question openers (STT sometimes drops '?')
-                return low.startswith(
-                    (
-                        "can you",
-                        "could you",
-                        "would you",
-                        "will you",
-                        "what ",
-                        "why ",
-                        "how ",
-                        "when ",
-                        "where ",
-                        "who ",
-                        "is ",
-                        "are ",
-                        "do ",
-                        "does ",
-                        "did ",
-                        "should ",
-                        "can ",
-                        "could ",
-                        "would ",
-                        "will ",
-                    )
-                )
-
-            def _keyword_recall_ok(raw: str, cleaned: str) -> bool:
-                """
-                Heuristic guardrail against cleanup that drops important context.
-                We compute a simple keyword recall over non-trivial tokens.
-                """
-                import re
-
-                def tokens(s: str) -> set[str]:
-                    s = (s or "").lower()
-                    # Keep words/numbers/identifiers (including underscores/slashes/dashes)
-                    parts = re.findall(r"[a-z0-9_./-]+", s)
-                    stop = {
-                        "the",
-                        "and",
-                        "that",
-                        "this",
-                        "with",
-                        "from",
-                        "have",
-                        "has",
-                        "had",
-                        "what",
-                        "when",
-                        "where",
-                        "which",
-                        "who",
-                        "whom",
-                        "why",
-                        "how",
-                        "can",
-                        "could",
-                        "would",
-                        "should",
-                        "will",
-                        "do",
-                        "does",
-                        "did",
-                        "a",
-                        "an",
-                        "to",
-                        "of",
-                        "in",
-                        "on",
-                        "for",
-                        "at",
-                        "it",
-                        "is",
-                        "are",
-                        "was",
-                        "were",
-                        "be",
-                        "been",
-                        "being",
-                        "i",
-                        "me",
-                        "my",
-                        "we",
-                        "our",
-                        "you",
-                        "your",
-                        "they",
-                        "their",
-                        "them",
-                    }
-                    # Keep "contentful" tokens: length>3 OR contains digit/symbol (e.g. ubuntu, smartctl, /dev/sda)
-                    out = set()
-                    for p in parts:
-                        if p in stop:
-                            continue
-                        if len(p) > 3 or any(ch.isdigit() for ch in p) or any(ch in p for ch in ("_", "/", "-", ".")):
-                            out.add(p)
-                    return out
-
-                raw_set = tokens(raw)
-                if not raw_set:
-                    return True
-                cleaned_set = tokens(cleaned)
-                recall = len(raw_set & cleaned_set) / max(1, len(raw_set))
-                return recall >= 0.70
-
-            if not GROQ_API_KEY or GROQ_API_KEY.startswith("your-"):
-                console.print("[yellow]⚠ Prompt cleanup enabled, but GROQ_API_KEY is not set. Sending raw transcript.[/yellow]")
-            elif not cleanup_prompt_via_groq or not CleanupConfig:
-                console.print("[yellow]⚠ Prompt cleanup module unavailable. Sending raw transcript.[/yellow]")
-            else:
-                console.print("[cyan]🧹 Cleaning up transcript (Groq)...[/cyan]")
-                cleaned = cleanup_prompt_via_groq(
-                    raw_transcript,
-                    CleanupConfig(
-                        api_key=GROQ_API_KEY,
-                        base_url=GROQ_BASE_URL,
-                        model=GROQ_CLEANUP_MODEL,
-                        timeout_s=GROQ_TIMEOUT_S,
-                    ),
-                )
-                if cleaned and cleaned.strip():
-                    # Safety: if the raw transcript is a question, do not allow cleanup to
-                    # turn it into a declarative/advice statement.
-                    raw_is_q = _looks_like_question(raw_transcript)
-                    cleaned_is_q = _looks_like_question(cleaned)
-                    length_ratio = (len(cleaned.strip()) / max(1, len(raw_transcript.strip()))) if raw_transcript else 1.0
-                    recall_ok = _keyword_recall_ok(raw_transcript, cleaned)
-
-                    if raw_is_q and not cleaned_is_q:
-                        console.print("[yellow]⚠ Prompt cleanup changed a question into a statement. Sending raw transcript.[/yellow]")
-                        console.print(f"[dim]   Raw:     {raw_transcript}[/dim]")
-                        console.print(f"[dim]   Cleaned:  {cleaned}[/dim]")
-                    elif length_ratio < 0.60 or not recall_ok:
-                        console.print("[yellow]⚠ Prompt cleanup removed too much context. Sending raw transcript.[/yellow]")
-                        console.print(f"[dim]   Raw:     {raw_transcript}[/dim]")
-                        console.print(f"[dim]   Cleaned:  {cleaned}[/dim]")
-                    else:
-                        message_text = cleaned
-                        if message_text != raw_transcript:
-                            console.print("[green]✓[/green] Transcript cleaned")
-                            console.print(f"[dim]   Before: {raw_transcript}[/dim]")
-                            console.print(f"[dim]   After:  {message_text}[/dim]")
-                else:
-                    console.print("[yellow]⚠ Prompt cleanup failed/timeout. Sending raw transcript.[/yellow]")
-        
-        # Add emotion context to message if emotions detected (structured JSON format)
-        if emotions and emotion_scores and ENABLE_EMOTION_ANALYSIS:
-            import json
-            # Build structured emotion metadata with scores nested
-            emotion_data = {
-                'source': 'hume_prosody',
-                'scores': emotion_scores
-            }
-            
-            # Add metadata if available
-            if result.get('emotion_metadata'):
-                metadata = result['emotion_metadata']
-                # Add all metadata fields
-                for key, value in metadata.items():
-                    emotion_data[key] = value
-            
-            emotion_json = json.dumps(emotion_data, separators=(',', ':'))
-            emotion_context = f"[voice_affect: {emotion_json}] "
-            message_with_context = emotion_context + message_text
-            
-            emotions_display = ', '.join([f"{e}({emotion_scores[e]:.2f})" for e in emotions])
-            console.print(f"[magenta]🎭 Adding emotion context:[/magenta] [dim]{emotions_display}[/dim]")
-            console.print(f"[dim]   Full message to send: {message_with_context[:100]}...[/dim]")
-        else:
-            message_with_context = message_text
-            console.print(f"[dim]   No emotion context (emotions={emotions}, scores={emotion_scores}, enabled={ENABLE_EMOTION_ANALYSIS})[/dim]")
-
-        # Optional: append response formatting hint (avoid newlines to prevent accidental submits)
-        append_text_source = RESPONSE_FORMAT_APPEND_TEXT
-        if ENABLE_TLDR_MARKERS and TLDRFormatConfig:
-            try:
-                append_text_source = TLDRFormatConfig(
-                    tldr_marker=TLDR_MARKER,
-                    full_marker=FULL_MARKER,
-                    end_marker=END_MARKER,
-                    tldr_sentences=TLDR_SENTENCES,
-                ).build_append_hint()
-            except Exception:
-                append_text_source = RESPONSE_FORMAT_APPEND_TEXT
-
-        if ENABLE_RESPONSE_FORMAT_HINT and append_text_source:
-            append_text = " ".join(str(append_text_source).strip().split())
-            if append_text:
-                joiner = " " if not message_with_context.endswith((" ", "\t")) else ""
-                message_with_context = f"{message_with_context}{joiner}{append_text}"
-                if ENABLE_TLDR_MARKERS:
-                    console.print("[dim]   🧾 Appended TL;DR marker format hint[/dim]")
-                else:
-                    console.print("[dim]   🧾 Appended response format hint (TL;DR + full answer)[/dim]")
+        message_future = MESSAGE_EXECUTOR.submit(build_message, result)
         
         # Step 2: Check if we have a screenshot (captured earlier)
-        if screenshot_path:
+        if screenshot_future:
+            console.print("[cyan]📸 Screenshot capture finishing in the background...[/cyan]")
+        elif screenshot_path:
             console.print(f"[cyan]📸 Using pre-captured screenshot:[/cyan] [dim]{screenshot_path}[/dim]")
         else:
             console.print("[yellow]⏭️  No screenshot (audio-only mode)[/yellow]")
 
         # Step 3: Check if user wants Deep Research mode (check original transcript, not emotion context)
         # Use *raw transcript* for mode switching decisions (avoid any chance a model alters keywords)
-        wants_deep_research = "research" in raw_transcript.lower()
+        wants_deep_research = RESEARCH_KEYWORD_RE.search(raw_transcript) is not None
         if wants_deep_research:
             console.print("[bold magenta]🔬 'research' detected - will enable Deep Research mode[/bold magenta]")
 
+        # The capture grabs live screen pixels, so it must finish before the tab
+        # switch and Chrome activation below change what is on screen
+        if screenshot_future:
+            screenshot_path = screenshot_future.result()
+            screenshot_future = None
+
         # Step 4: Find and switch to Perplexity tab
         global PERPLEXITY_WINDOW_HANDLE
         console.print("[bold]🔍 Looking for Perplexity tab...[/bold]")
@@ -1043,64 +1317,37 @@ def send_to_perplexity(driver, wait, result, screenshot_path=None):
                 perplexity_handle = current_handle
                 PERPLEXITY_WINDOW_HANDLE = perplexity_handle
                 console.print("[green]✓[/green] Already on Perplexity tab")
-                
-                # Still need to bring Chrome to front
-                try:
-                    subprocess.run([
-                        "osascript", "-e",
-                        'tell application "Google Chrome" to activate'
-                    ], check=False, capture_output=True, timeout=2)
-                    time.sleep(0.3)
-                except (subprocess.SubprocessError, subprocess.TimeoutExpired):
-                    pass  # Chrome activation not critical
         except Exception:
             pass  # URL check failed
         
-        # If not, check cached handle first
-        if not perplexity_handle and PERPLEXITY_WINDOW_HANDLE:
-            try:
-                driver.switch_to.window(PERPLEXITY_WINDOW_HANDLE)
-                if 'perplexity.ai' in driver.current_url:
-                    perplexity_handle = PERPLEXITY_WINDOW_HANDLE
-                    console.print("[green]✓[/green] Switched to cached Perplexity tab")
-                    
-                    # Bring Chrome to front
-                    try:
-                        subprocess.run([
-                            "osascript", "-e",
-                            'tell application "Google Chrome" to activate'
-                        ], check=False, capture_output=True, timeout=2)
-                        time.sleep(0.3)
-                    except (subprocess.SubprocessError, subprocess.TimeoutExpired):
-                        pass  # Chrome activation not critical
-            except Exception:
-                # Handle no longer valid, clear cache
-                PERPLEXITY_WINDOW_HANDLE = None
-                driver.switch_to.window(current_handle)
-        
-        # If still not found, search through all windows (Selenium requires switching to check URL)
+        # If not, ask Chrome for every tab's URL in one CDP call instead of switching
+        # into each tab (chromedriver window handles are the CDP target IDs). The
+        # cached tab wins if it still shows Perplexity; then switch exactly once.
         if not perplexity_handle:
-            console.print("   [dim]Searching all tabs for perplexity.ai...[/dim]")
-            original_handle = driver.current_window_handle
-            
-            for handle in driver.window_handles:
-                try:
-                    driver.switch_to.window(handle)
-                    if 'perplexity.ai' in driver.current_url:
-                        perplexity_handle = handle
-                        PERPLEXITY_WINDOW_HANDLE = perplexity_handle
-                        console.print(f"   [green]✓[/green] Found Perplexity tab")
-                        break
-                    else:
-                        # Switch back immediately if not the right window
-                        driver.switch_to.window(original_handle)
-                except Exception:
-                    # Switching failed, try to recover
-                    try:
-                        driver.switch_to.window(original_handle)
-                    except Exception:
-                        pass  # Can't recover, continue to next window
-                    continue
+            try:
+                targets = driver.execute_cdp_cmd('Target.getTargets', {})['targetInfos']
+                perplexity_tabs = [
+                    t['targetId'] for t in targets
+                    if t.get('type') == 'page' and 'perplexity.ai' in t.get('url', '')
+                ]
+                if PERPLEXITY_WINDOW_HANDLE in perplexity_tabs:
+                    match = PERPLEXITY_WINDOW_HANDLE
+                    found_message = "[green]✓[/green] Switched to cached Perplexity tab"
+                else:
+                    # Cached tab was closed or navigated away
+                    PERPLEXITY_WINDOW_HANDLE = None
+                    match = perplexity_tabs[0] if perplexity_tabs else None
+                    found_message = "[green]✓[/green] Found Perplexity tab"
+                
+                if match:
+                    driver.switch_to.window(match)
+                    perplexity_handle = match
+                    PERPLEXITY_WINDOW_HANDLE = perplexity_handle
+                    console.print(found_message)
+            except NoSuchWindowException:
+                PERPLEXITY_WINDOW_HANDLE = None  # Tab closed between lookup and switch
+            except (WebDriverException, KeyError):
+                pass  # CDP lookup failed, treated as not found below
         
         if not perplexity_handle:
             console.print("[bold red]❌ Could not find Perplexity tab![/bold red]")
@@ -1112,23 +1359,16 @@ def send_to_perplexity(driver, wait, result, screenshot_path=None):
                 pass  # Can't switch back, continue anyway
             return
         
-        # Bring Chrome window to front at macOS level
-        try:
-            console.print("   [dim]Bringing Chrome to front...[/dim]")
-            subprocess.run([
-                "osascript", "-e",
-                'tell application "Google Chrome" to activate'
-            ], check=False, capture_output=True, timeout=2)
-            time.sleep(0.5)  # Give time for window to come forward
-            console.print("   [green]✓[/green] Chrome activated")
-        except Exception as e:
-            console.print(f"   [yellow]⚠[/yellow] Could not activate Chrome window: {e}")
+        # Bring Chrome window to front at macOS level. Runs in the background while
+        # we locate the chat input and set the mode (DOM work that doesn't need focus).
+        console.print("   [dim]Bringing Chrome to front...[/dim]")
+        activate_process = start_chrome_activation()
         
         # Now find the chat input
         console.print("[bold]🔍 Looking for chat input...[/bold]")
         try:
             chat_input = wait.until(
-                EC.presence_of_element_located((By.XPATH, "//div[@contenteditable='true' and @role='textbox']"))
+                EC.presence_of_element_located(CHAT_INPUT_LOCATOR)
             )
             console.print("[green]✓[/green] Found chat input!")
         except Exception as e:
@@ -1136,76 +1376,31 @@ def send_to_perplexity(driver, wait, result, screenshot_path=None):
             console.print(f"   [dim]Page title: {driver.title}[/dim]")
             return
 
+        # Waits for UI state changes return as soon as the change is seen
+        fast_wait = WebDriverWait(driver, UI_WAIT_TIMEOUT_S, poll_frequency=UI_POLL_S)
+        
         # Step 5: Set search mode (Search vs Research) for this query
         # It's a segmented control: click "Search" for normal, "Research" for deep research
         try:
-            def _find_mode_button(label: str):
-                # Try a few selector variants (Perplexity UI sometimes changes role/structure)
-                xpaths = [
-                    f"//button[@aria-label='{label}' and @role='radio']",
-                    f"//button[@aria-label='{label}']",
-                    f"//div[@role='radiogroup']//button[@aria-label='{label}']",
-                    f"//div[@role='radiogroup']//button[normalize-space()='{label}']",
-                    f"//button[normalize-space()='{label}']",
-                ]
-                for xp in xpaths:
-                    try:
-                        candidates = driver.find_elements(By.XPATH, xp)
-                        for el in candidates:
-                            try:
-                                if el.is_displayed():
-                                    return el
-                            except Exception:
-                                continue
-                    except Exception:
-                        continue
-                return None
-
-            def _find_mode_button_contains(substr: str):
-                """Find a button whose aria-label contains a substring (case-insensitive)."""
-                s = (substr or "").strip().lower()
-                if not s:
-                    return None
-                xp = (
-                    "//button[contains(translate(@aria-label,"
-                    " 'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),"
-                    f" '{s}')]"
+            def _find_mode_buttons(_driver):
+                """Visible (Search, Research) buttons in one round-trip; False until either exists."""
+                buttons = driver.execute_script(
+                    FIND_MODE_BUTTONS_JS, SEARCH_BUTTON_XPATHS, RESEARCH_BUTTON_XPATHS
                 )
-                try:
-                    candidates = driver.find_elements(By.XPATH, xp)
-                except Exception:
-                    candidates = []
-                for el in candidates:
-                    try:
-                        if el.is_displayed():
-                            return el
-                    except Exception:
-                        continue
-                return None
+                return buttons if any(buttons) else False
 
             def _is_checked(btn) -> bool:
+                # Read both state attributes in one round-trip
                 try:
-                    if (btn.get_attribute("data-state") or "").lower() == "checked":
-                        return True
-                except Exception:
-                    pass
-                try:
-                    if (btn.get_attribute("aria-checked") or "").lower() == "true":
-                        return True
+                    return bool(driver.execute_script(IS_CHECKED_JS, btn))
                 except Exception:
-                    pass
-                return False
+                    return False
 
             # Wait briefly for the segmented control/buttons to exist
             try:
-                WebDriverWait(driver, 5).until(
-                    lambda d: _find_mode_button("Search") is not None or _find_mode_button("Research") is not None
-                )
-            except Exception:
-                pass
-
-            search_button = _find_mode_button("Search")
-            research_button = _find_mode_button("Research") or _find_mode_button_contains("research")
+                search_button, research_button = WebDriverWait(driver, 5).until(_find_mode_buttons)
+            except TimeoutException:
+                search_button = research_button = None
 
             if not search_button:
                 # If we can't find Search at all, we can't safely change modes.
@@ -1228,7 +1423,10 @@ def send_to_perplexity(driver, wait, result, screenshot_path=None):
                         research_button.click()
                     except Exception:
                         driver.execute_script("arguments[0].click();", research_button)
-                    time.sleep(0.5)
+                    try:
+                        fast_wait.until(lambda _d: _is_checked(research_button))
+                    except TimeoutException:
+                        pass
                     console.print("[green]   ✓[/green] Deep Research mode enabled")
                 
             elif not wants_deep_research and is_research_on:
@@ -1238,7 +1436,10 @@ def send_to_perplexity(driver, wait, result, screenshot_path=None):
                     search_button.click()
                 except Exception:
                     driver.execute_script("arguments[0].click();", search_button)
-                time.sleep(0.5)
+                try:
+                    fast_wait.until(lambda _d: not _is_checked(research_button))
+                except TimeoutException:
+                    pass
                 console.print("[green]   ✓[/green] Normal Search mode enabled")
             else:
                 console.print(f"[dim]   ✓ Already in correct mode[/dim]")
@@ -1247,150 +1448,162 @@ def send_to_perplexity(driver, wait, result, screenshot_path=None):
             console.print(f"[yellow]⚠[/yellow] Could not set search mode: {e}")
             console.print("[dim]   Continuing with current mode...[/dim]")
 
+        message_with_context = message_future.result()
+        
+        # Chrome must be frontmost before we click into it and type
+        if wait_for_chrome_front(activate_process):
+            console.print("   [green]✓[/green] Chrome activated")
+        else:
+            console.print("   [yellow]⚠[/yellow] Chrome did not come to the front; continuing anyway")
+        
         # Step 6: Type the transcribed message (with emotion context if available)
         console.print(f"[bold]⌨️  Typing message:[/bold] [cyan]\"{message_with_context}\"[/cyan]")
         chat_input.click()
-        chat_input.send_keys(message_with_context)
+        try:
+            # One native text insertion (fires beforeinput/input like an IME commit)
+            # instead of send_keys' key event per character
+            # Compare against the text before inserting: a leftover draft in the
+            # editor must not count as proof that the insert worked
+            text_before = len(chat_input.text)
+            driver.execute_cdp_cmd("Input.insertText", {"text": message_with_context})
+            inserted = len(chat_input.text) > text_before
+        except WebDriverException:
+            inserted = False
+        if not inserted:
+            chat_input.send_keys(message_with_context)
         console.print("[green]✓[/green] Message typed!")
 
+        def _capture_prev_response_text():
+            """Latest TL;DR-containing block *before* sending, so we don't accidentally
+            speak the previous answer again when multiple answers exist."""
+            if not (ENABLE_LOCAL_TTS and ENABLE_TLDR_MARKERS and wait_for_latest_response_text):
+                return ""
+            try:
+                return (
+                    wait_for_latest_response_text(
+                        driver,
+                        timeout_s=1.5,
+                        settle_s=0.2,
+                        poll_s=0.2,
+                        prefer_marker=TLDR_MARKER,
+                        require_all=[TLDR_MARKER],
+                    )
+                    or ""
+                )
+            except Exception:
+                return ""
+        
+        # Captured while an upload is in flight when there is one, else in Step 7
+        prev_response_text = None
+        
         # Step 6: Upload screenshot AFTER typing message
         if screenshot_path:
             console.print(f"[bold]📤 Preparing to upload file:[/bold] [dim]{screenshot_path}[/dim]")
             
-            # Debug: Show current browser window info
-            try:
-                current_url = driver.current_url
-                current_title = driver.title
-                current_handle = driver.current_window_handle
-                print(f"   Browser state:")
-                print(f"   - URL: {current_url}")
-                print(f"   - Title: {current_title}")
-                print(f"   - Handle: {current_handle}")
-            except Exception as e:
-                print(f"   ⚠ Could not get window info: {e}")
-            
-            # Debug: Show macOS focused application
-            try:
-                import Cocoa
-                frontmost_app = Cocoa.NSWorkspace.sharedWorkspace().frontmostApplication()
-                app_name = frontmost_app.localizedName()
-                app_pid = frontmost_app.processIdentifier()
-                print(f"   - macOS focus: {app_name} (PID: {app_pid})")
-            except Exception as e:
-                print(f"   ⚠ Could not get macOS app info: {e}")
+            if DEBUG_UPLOAD:
+                # Debug: Show current browser window info
+                # (one script call; the handle is already known from Step 4)
+                try:
+                    current_url, current_title = driver.execute_script(
+                        "return [location.href, document.title];"
+                    )
+                    print(f"   Browser state:")
+                    print(f"   - URL: {current_url}")
+                    print(f"   - Title: {current_title}")
+                    print(f"   - Handle: {perplexity_handle}")
+                except Exception as e:
+                    print(f"   ⚠ Could not get window info: {e}")
+                
+                # Debug: Show macOS focused application
+                try:
+                    import Cocoa
+                    frontmost_app = Cocoa.NSWorkspace.sharedWorkspace().frontmostApplication()
+                    app_name = frontmost_app.localizedName()
+                    app_pid = frontmost_app.processIdentifier()
+                    print(f"   - macOS focus: {app_name} (PID: {app_pid})")
+                except Exception as e:
+                    print(f"   ⚠ Could not get macOS app info: {e}")
             
             # Ensure chat input still has focus and page is ready
             try:
-                # Re-find chat input to ensure it's still valid
-                chat_input = driver.find_element(By.XPATH, "//div[@contenteditable='true' and @role='textbox']")
-                # Click it to ensure focus
-                chat_input.click()
-                time.sleep(0.3)
+                # Reuse the element from Step 4; re-find only if the editor re-rendered
+                try:
+                    chat_input.click()
+                except StaleElementReferenceException:
+                    chat_input = driver.find_element(*CHAT_INPUT_LOCATOR)
+                    chat_input.click()
+                try:
+                    fast_wait.until(lambda d: d.execute_script(HAS_FOCUS_JS, chat_input))
+                except TimeoutException:
+                    pass
                 print("   ✓ Chat input re-focused")
             except Exception as e:
                 print(f"   ⚠ Could not re-focus chat input: {e}")
             
             # Verify file exists and is readable before uploading
+            # (one stat call answers exists / size / is-a-file)
             file_path = Path(screenshot_path)
-            if not file_path.exists():
+            try:
+                file_stat = file_path.stat()
+            except FileNotFoundError:
+                file_stat = None
+            if file_stat is None:
                 console.print("[red]✗ File doesn't exist, skipping upload[/red]")
             else:
-                file_size = file_path.stat().st_size
+                file_size = file_stat.st_size
                 print(f"   File size: {file_size:,} bytes ({file_size / (1024*1024):.2f} MB)")
                 
                 # Get absolute path - must be a single file, not a directory
                 abs_path = str(file_path.resolve())
                 
                 # Double-check it's a file, not a directory
-                if not file_path.is_file():
+                if not stat.S_ISREG(file_stat.st_mode):
                     console.print(f"[red]✗ ERROR: Path is not a file:[/red] {abs_path}")
                 else:
                     print(f"   Attempting file upload: {abs_path}")
                     
-                    # Find ALL file input elements
-                    file_inputs = driver.find_elements(By.XPATH, "//input[@type='file']")
-                    print(f"   Found {len(file_inputs)} file input(s)")
+                    # Clear ALL file inputs (prevents accumulation from previous runs) and
+                    # pick the first one, in a single round-trip
+                    prepared = driver.execute_script(PREPARE_FILE_INPUTS_JS)
                     
-                    if not file_inputs:
+                    if not prepared:
                         print("   ✗ ERROR: No file input found!")
                         print("   This may indicate the page structure has changed or page isn't ready")
                     else:
-                        # Clear ALL file inputs to prevent accumulation from previous runs
-                        print("   Clearing all file inputs...")
-                        for idx, inp in enumerate(file_inputs):
-                            try:
-                                driver.execute_script("arguments[0].value = '';", inp)
-                                print(f"   - Cleared input {idx}")
-                            except (StaleElementReferenceException, Exception) as e:
-                                print(f"   - Could not clear input {idx}: {e}")
+                        file_input = prepared['input']
+                        print(f"   Found {prepared['count']} file input(s), cleared")
+                        print(f"   Input attributes: multiple={prepared['multiple']}, accept={prepared['accept']}")
                         
-                        time.sleep(0.5)  # Brief pause after clearing
+                        # Send ONLY this one file path to the first input
+                        print(f"   Sending file path to input...")
+                        try:
+                            file_input.send_keys(abs_path)
+                            print("   ✓ File path sent to input!")
+                        except StaleElementReferenceException:
+                            print("   ⚠ File input went stale during send, re-querying and retrying...")
+                            prepared = driver.execute_script(PREPARE_FILE_INPUTS_JS)
+                            if not prepared:
+                                raise Exception("File inputs disappeared")
+                            file_input = prepared['input']
+                            file_input.send_keys(abs_path)
+                            print("   ✓ File path sent to input (after retry)!")
                         
-                        # Re-query file inputs after clearing (prevents stale element if page re-rendered)
-                        file_inputs = driver.find_elements(By.XPATH, "//input[@type='file']")
-                        if not file_inputs:
-                            print("   ✗ ERROR: File inputs disappeared after clearing!")
-                            print("   Skipping upload...")
-                        else:
-                            print(f"   Re-queried: found {len(file_inputs)} file input(s)")
-                            
-                            # Use the first file input (freshly queried)
-                            file_input = file_inputs[0]
-                            
-                            # Check if it accepts multiple files
-                            try:
-                                multiple_attr = file_input.get_attribute('multiple')
-                                accept_attr = file_input.get_attribute('accept')
-                                print(f"   Input attributes: multiple={multiple_attr}, accept={accept_attr}")
-                            except StaleElementReferenceException:
-                                print("   ⚠ File input went stale, re-querying one more time...")
-                                file_inputs = driver.find_elements(By.XPATH, "//input[@type='file']")
-                                if not file_inputs:
-                                    print("   ✗ ERROR: Cannot find file inputs!")
-                                    raise
-                                file_input = file_inputs[0]
-                                multiple_attr = file_input.get_attribute('multiple')
-                                accept_attr = file_input.get_attribute('accept')
-                                print(f"   Input attributes: multiple={multiple_attr}, accept={accept_attr}")
-                            
-                            # Send ONLY this one file path to the first input
-                            print(f"   Sending file path to input...")
-                            try:
-                                file_input.send_keys(abs_path)
-                                print("   ✓ File path sent to input!")
-                            except StaleElementReferenceException:
-                                print("   ⚠ File input went stale during send, re-querying and retrying...")
-                                file_inputs = driver.find_elements(By.XPATH, "//input[@type='file']")
-                                if file_inputs:
-                                    file_input = file_inputs[0]
-                                    file_input.send_keys(abs_path)
-                                    print("   ✓ File path sent to input (after retry)!")
-                                else:
-                                    raise Exception("File inputs disappeared")
-                            
-                            # Verify the file was actually added
-                            time.sleep(1)
-                            try:
-                                files_added = driver.execute_script("return arguments[0].files.length", file_input)
-                                print(f"   Browser reports {files_added} file(s) in input")
-                                if files_added == 0:
-                                    print("   ⚠ WARNING: No files in input! Upload may have failed.")
-                                else:
-                                    # Get file info from browser
-                                    file_info = driver.execute_script("""
-                                        const file = arguments[0].files[0];
-                                        return file ? {
-                                            name: file.name,
-                                            size: file.size,
-                                            type: file.type
-                                        } : null;
-                                    """, file_input)
-                                    if file_info:
-                                        print(f"   ✓ File in browser: {file_info['name']} ({file_info['size']} bytes)")
-                            except StaleElementReferenceException as e:
-                                print(f"   ⚠ Could not verify file (element stale): {e}")
-                            except Exception as e:
-                                print(f"   ⚠ Could not verify file: {e}")
+                        # Verify the file was actually added (send_keys sets files synchronously)
+                        try:
+                            file_info = driver.execute_script(FILE_INPUT_INFO_JS, file_input)
+                            print(f"   Browser reports {file_info['count']} file(s) in input")
+                            if file_info['count'] == 0:
+                                print("   ⚠ WARNING: No files in input! Upload may have failed.")
+                            else:
+                                print(f"   ✓ File in browser: {file_info['name']} ({file_info['size']} bytes)")
+                        except StaleElementReferenceException as e:
+                            print(f"   ⚠ Could not verify file (element stale): {e}")
+                        except Exception as e:
+                            print(f"   ⚠ Could not verify file: {e}")
+                
+                    # Scrape the previous answer while the browser uploads, instead of
+                    # after the upload wait
+                    prev_response_text = _capture_prev_response_text()
                 
                 # Wait for upload to complete by watching for remove button
                 console.print("[bold yellow]📤 Waiting for upload to complete...[/bold yellow]")
@@ -1398,7 +1611,7 @@ def send_to_perplexity(driver, wait, result, screenshot_path=None):
                     # Wait for the remove button to appear (indicates upload complete)
                     # This returns immediately when found, no arbitrary delays!
                     remove_button = wait.until(
-                        EC.presence_of_element_located((By.XPATH, "//button[@data-testid='remove-uploaded-file']"))
+                        EC.presence_of_element_located(REMOVE_UPLOAD_LOCATOR)
                     )
                     console.print("[green]✓ Upload complete![/green]")
                     
@@ -1407,13 +1620,7 @@ def send_to_perplexity(driver, wait, result, screenshot_path=None):
                     console.print("[dim]   Remove button not found, trying fallback detection...[/dim]")
                     try:
                         # Look for any upload indicator as backup
-                        wait.until(
-                            EC.presence_of_element_located((By.XPATH, 
-                                "//img[contains(@src, 'blob:')] | "
-                                "//div[contains(@class, 'preview')] | "
-                                "//button[contains(@aria-label, 'Remove')]"
-                            ))
-                        )
+                        wait.until(EC.presence_of_element_located(UPLOAD_INDICATOR_LOCATOR))
                         console.print("[green]✓ Upload detected (fallback method)![/green]")
                     except TimeoutException:
                         console.print(f"[yellow]⚠ No upload indicator after 20s[/yellow]")
@@ -1422,27 +1629,11 @@ def send_to_perplexity(driver, wait, result, screenshot_path=None):
         # Step 7: Click send (no delays needed for audio-only)
         console.print("[bold]🔍 Looking for send button...[/bold]")
         try:
-            # Capture the latest TL;DR-containing block *before* sending, so we don't
-            # accidentally speak the previous answer again when multiple answers exist.
-            prev_response_text = ""
-            if ENABLE_LOCAL_TTS and ENABLE_TLDR_MARKERS and wait_for_latest_response_text:
-                try:
-                    prev_response_text = (
-                        wait_for_latest_response_text(
-                            driver,
-                            timeout_s=1.5,
-                            settle_s=0.2,
-                            poll_s=0.2,
-                            prefer_marker=TLDR_MARKER,
-                            require_all=[TLDR_MARKER],
-                        )
-                        or ""
-                    )
-                except Exception:
-                    prev_response_text = ""
+            if prev_response_text is None:
+                prev_response_text = _capture_prev_response_text()
 
             send_button = wait.until(
-                EC.element_to_be_clickable((By.XPATH, "//button[@aria-label='Submit']"))
+                EC.element_to_be_clickable(SUBMIT_BUTTON_LOCATOR)
             )
             console.print("[bold cyan]🚀 Clicking send...[/bold cyan]")
             
@@ -1461,9 +1652,21 @@ def send_to_perplexity(driver, wait, result, screenshot_path=None):
                 play_submit_beep()  # Audio feedback
                 console.print("[green]✓[/green] Send button clicked (via JavaScript)!")
             
-            # Wait a bit to see if message was sent
+            # Wait until the page reacts to the submit (button swapped or gone)
             console.print("[dim]Waiting for message to send...[/dim]")
-            time.sleep(3)
+
+            def _message_sent(d):
+                try:
+                    if not send_button.is_enabled():
+                        return True
+                except StaleElementReferenceException:
+                    return True
+                return bool(d.find_elements(*STOP_BUTTON_LOCATOR))
+
+            try:
+                WebDriverWait(driver, 3, poll_frequency=UI_POLL_S).until(_message_sent)
+            except TimeoutException:
+                pass
 
             # Optional: fetch formatted response and speak TL;DR locally
             if ENABLE_LOCAL_TTS and wait_for_latest_response_text and extract_tldr and speak_local_mac and TLDRFormatConfig and LocalTTSConfig:
@@ -1533,26 +1736,27 @@ def send_to_perplexity(driver, wait, result, screenshot_path=None):
         console.print("[bold]🦶 Try again[/bold] [dim](Left pedal = screenshot, Right pedal = audio only)...[/dim]\n")
     
     finally:
-        # Clean up temporary files
-        if audio_path and Path(audio_path).exists():
-            try:
-                Path(audio_path).unlink()
-                console.print("[dim]🗑️  Cleaned up audio file[/dim]")
-            except Exception as e:
-                console.print(f"[yellow]⚠[/yellow] Could not delete audio file: {e}")
-        
         # Clean up screenshot
-        if screenshot_path and Path(screenshot_path).exists():
+        if screenshot_future:
+            # Returned before the upload step; still wait so the file can be removed
+            try:
+                screenshot_path = screenshot_future.result()
+            except Exception:
+                screenshot_path = None
+        if screenshot_path:
             try:
                 Path(screenshot_path).unlink()
                 console.print("[dim]🗑️  Cleaned up screenshot file[/dim]")
+            except FileNotFoundError:
+                pass  # Already gone
             except Exception as e:
                 console.print(f"[yellow]⚠[/yellow] Could not delete screenshot file: {e}")
 
 
 # ============ KEYBOARD LISTENER ============
+@functools.cache
 def get_trigger_key_map():
-    """Map trigger key strings to pynput Key objects."""
+    """Map trigger key strings to pynput Key objects (built once)."""
     from pynput.keyboard import Key
     
     return {
@@ -1566,25 +1770,51 @@ def get_trigger_key_map():
         'ctrl': Key.ctrl,
     }
 
-def check_key_match(key, trigger_key_str):
-    """Check if a key matches a trigger key string."""
-    try:
-        trigger_map = get_trigger_key_map()
-        
-        # Check for mapped modifier keys
-        if trigger_key_str.lower() in trigger_map:
-            return key == trigger_map[trigger_key_str.lower()]
-        
-        # Check for function keys (f1-f12, etc.)
-        if hasattr(key, 'name'):
-            return key.name.lower() == trigger_key_str.lower()
-        
+
+def make_key_matcher(trigger_key_str):
+    """Build a predicate that checks if a key matches a trigger key string.
+    
+    Resolves the trigger once (modifier, named key or character), so each key
+    event only runs the comparison that applies to it.
+    """
+    trigger_lower = trigger_key_str.lower()
+    
+    # Mapped modifier keys (Key members are singletons)
+    target = get_trigger_key_map().get(trigger_lower)
+    if target is not None:
+        return lambda key: key is target
+    
+    def _match(key):
+        # Function keys (f1-f12, etc.)
+        name = getattr(key, 'name', None)
+        if name is not None:
+            return name.lower() == trigger_lower
         # Fallback for character keys
-        if hasattr(key, 'char'):
-            return key.char == trigger_key_str
-    except (AttributeError, TypeError):
-        pass  # Key object doesn't have expected attributes
-    return False
+        return getattr(key, 'char', None) == trigger_key_str
+    
+    return _match
+
+
+is_screenshot_trigger = make_key_matcher(TRIGGER_KEY_WITH_SCREENSHOT)
+is_audio_only_trigger = make_key_matcher(TRIGGER_KEY_AUDIO_ONLY)
+
+# Display names for the trigger keys, e.g. 'cmd_r' -> 'Cmd (Right)'
+SCREENSHOT_KEY_DISPLAY = TRIGGER_KEY_WITH_SCREENSHOT.replace('_r', ' (Right)').replace('_', ' ').title()
+AUDIO_ONLY_KEY_DISPLAY = TRIGGER_KEY_AUDIO_ONLY.replace('_r', ' (Right)').replace('_', ' ').title()
+
+# Key-press banners, printed with one console.print before recording starts
+_RULE = "[dim]" + "="*60 + "[/dim]"
+SCREENSHOT_PRESS_BANNER = (
+    f"\n{_RULE}\n"
+    f"[bold cyan]🦶 {SCREENSHOT_KEY_DISPLAY} PRESSED[/bold cyan] - Recording with screenshot...\n"
+    f"{_RULE}"
+)
+AUDIO_ONLY_PRESS_BANNER = (
+    f"\n{_RULE}\n"
+    f"[bold yellow]🦶 {AUDIO_ONLY_KEY_DISPLAY} PRESSED[/bold yellow] - Recording audio only...\n"
+    f"{_RULE}"
+)
+
 
 def on_press(key, audio_processor):
     """Handle key press events - start recording."""
@@ -1592,14 +1822,11 @@ def on_press(key, audio_processor):
     
     try:
         # Check for screenshot + audio trigger
-        if check_key_match(key, TRIGGER_KEY_WITH_SCREENSHOT):
+        if is_screenshot_trigger(key):
             if not audio_processor.recorder.is_recording:
                 play_double_beep()  # Audio feedback
                 audio_processor.recorder.capture_screenshot = True
-                key_display = TRIGGER_KEY_WITH_SCREENSHOT.replace('_r', ' (Right)').replace('_', ' ').title()
-                console.print("\n[dim]" + "="*60 + "[/dim]")
-                console.print(f"[bold cyan]🦶 {key_display} PRESSED[/bold cyan] - Recording with screenshot...")
-                console.print("[dim]" + "="*60 + "[/dim]")
+                console.print(SCREENSHOT_PRESS_BANNER)
                 
                 # Start region selector for optional drag-to-select
                 REGION_SELECTOR = RegionSelector()
@@ -1615,14 +1842,11 @@ def on_press(key, audio_processor):
                 audio_processor.start_recording(take_screenshot=False)
         
         # Check for audio-only trigger
-        elif check_key_match(key, TRIGGER_KEY_AUDIO_ONLY):
+        elif is_audio_only_trigger(key):
             if not audio_processor.recorder.is_recording:
                 play_start_beep()  # Audio feedback
                 audio_processor.recorder.capture_screenshot = False
-                key_display = TRIGGER_KEY_AUDIO_ONLY.replace('_r', ' (Right)').replace('_', ' ').title()
-                console.print("\n[dim]" + "="*60 + "[/dim]")
-                console.print(f"[bold yellow]🦶 {key_display} PRESSED[/bold yellow] - Recording audio only...")
-                console.print("[dim]" + "="*60 + "[/dim]")
+                console.print(AUDIO_ONLY_PRESS_BANNER)
                 audio_processor.start_recording(take_screenshot=False)
     except Exception as e:
         print(f"Error in key press handler: {e}")
@@ -1633,90 +1857,99 @@ def on_release(key, audio_processor, driver, wait):
     
     try:
         # Check if either trigger key was released
-        if check_key_match(key, TRIGGER_KEY_WITH_SCREENSHOT) or check_key_match(key, TRIGGER_KEY_AUDIO_ONLY):
-            if audio_processor.recorder.is_recording:
+        if is_screenshot_trigger(key) or is_audio_only_trigger(key):
+            recorder = audio_processor.recorder
+            if recorder.is_recording:
                 play_stop_beep()  # Audio feedback
-                screenshot_path = None
                 
                 # Handle screenshot capture (only for screenshot mode)
                 try:
-                    if audio_processor.recorder.capture_screenshot:
-                        # Stop the region selector
-                        if REGION_SELECTOR:
-                            REGION_SELECTOR.stop()
-                            region = REGION_SELECTOR.get_region()
-                            REGION_SELECTOR = None
+                    screenshot_future = None
+                    if recorder.capture_screenshot:
+                        # Stop the region selector (take it out of the global first,
+                        # so a re-entrant release can't stop it twice)
+                        region_selector, REGION_SELECTOR = REGION_SELECTOR, None
+                        if region_selector:
+                            region_selector.stop()
+                            region = region_selector.get_region()
                             
-                            if region:
-                                # User selected a region - capture it
-                                console.print("[cyan]📸 Capturing selected region...[/cyan]")
-                                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                                screenshot_path = Path(f"/tmp/perplexity_screenshot_{timestamp}.png")
-                                
-                                if capture_region_screenshot(region, screenshot_path):
-                                    console.print("[green]✓ Region screenshot captured![/green]")
-                                else:
-                                    console.print("[yellow]⚠ Region capture failed, trying window fallback...[/yellow]")
-                                    screenshot_path = None
-                            
-                            # No region selected or region capture failed - use window fallback
-                            if not screenshot_path:
-                                console.print(f"[cyan]📸 Capturing window:[/cyan] {getattr(audio_processor.recorder, 'fallback_app_name', 'unknown')}...")
-                                screenshot_path = capture_screenshot_func(
-                                    getattr(audio_processor.recorder, 'fallback_window_id', None),
-                                    getattr(audio_processor.recorder, 'fallback_app_name', None),
-                                    getattr(audio_processor.recorder, 'fallback_bounds', None)
-                                )
-                                if screenshot_path:
-                                    console.print("[green]✓ Window screenshot captured![/green]")
-                                else:
-                                    console.print("[yellow]⚠ Screenshot capture failed[/yellow]")
+                            # Capture + sharpen on a worker so it overlaps transcription
+                            screenshot_future = SCREENSHOT_EXECUTOR.submit(
+                                capture_release_screenshot,
+                                region,
+                                recorder.fallback_window_id,
+                                recorder.fallback_app_name,
+                                recorder.fallback_bounds,
+                            )
                     
                     # Stop audio recording and process (transcription + emotion)
                     result = audio_processor.stop_recording_and_process()
                     
                     if result:
-                        send_to_perplexity(driver, wait, result, screenshot_path)
+                        # send_to_perplexity waits for the capture before it touches Chrome
+                        send_to_perplexity(driver, wait, result, screenshot_future=screenshot_future)
                         
                 finally:
                     # Ensure region selector is cleaned up even if exception occurred
-                    if REGION_SELECTOR:
+                    region_selector, REGION_SELECTOR = REGION_SELECTOR, None
+                    if region_selector:
                         try:
-                            REGION_SELECTOR.stop()
-                        except Exception:
-                            pass
-                        REGION_SELECTOR = None
+                            region_selector.stop()
+                        except (AttributeError, RuntimeError):
+                            pass  # stop() already handles overlay I/O errors itself
                     
     except Exception as e:
+        # Kept broad on purpose: an exception escaping a pynput callback stops the
+        # keyboard listener, which would end the app
         print(f"Error in key release handler: {e}")
         # Clean up region selector if there was an error
-        if REGION_SELECTOR:
-            REGION_SELECTOR.stop()
-            REGION_SELECTOR = None
+        region_selector, REGION_SELECTOR = REGION_SELECTOR, None
+        if region_selector:
+            region_selector.stop()
 
 
 # ============ STARTUP CLEANUP ============
+# Loose macPerplex files in /tmp as (name prefix, name suffix): saved debug
+# recordings, and screenshots/region files written by older versions
+ORPHANED_TEMP_FILES = (
+    ("perplexity_screenshot_", ""),
+    ("perplexity_audio_", ".wav"),
+    ("perplexity_temp", ".png"),
+    ("region_", ".txt"),
+)
+
+
 def cleanup_orphaned_temp_files():
     """Clean up any orphaned temp files from previous runs/crashes."""
-    import glob
-    import os
-    
     try:
-        # Find all macPerplex temp files
-        patterns = [
-            "/tmp/perplexity_screenshot_*.png",
-            "/tmp/perplexity_audio_*.wav",
-            "/tmp/perplexity_temp*.png",
-            "/tmp/region_*.txt"
-        ]
-        
+        # Find all macPerplex temp files in a single pass over /tmp
+        prefixes = tuple(prefix for prefix, _ in ORPHANED_TEMP_FILES)
+        now = time.time()
         cleaned = 0
-        for pattern in patterns:
-            for filepath in glob.glob(pattern):
+        with os.scandir("/tmp") as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith(TEMP_DIR_PREFIX) and entry.path != str(TEMP_DIR):
+                    # Scratch directory of a run that didn't exit cleanly
+                    try:
+                        if (entry.is_dir(follow_symlinks=False)
+                                and now - entry.stat(follow_symlinks=False).st_mtime > 3600):
+                            shutil.rmtree(entry.path)
+                            cleaned += 1
+                    except Exception:
+                        pass  # Directory might be in use or already deleted
+                    continue
+                if not name.startswith(prefixes):
+                    continue
+                if not any(
+                    name.startswith(prefix) and name.endswith(suffix)
+                    for prefix, suffix in ORPHANED_TEMP_FILES
+                ):
+                    continue
                 try:
                     # Delete files older than 1 hour
-                    if time.time() - os.path.getmtime(filepath) > 3600:
-                        os.unlink(filepath)
+                    if now - entry.stat(follow_symlinks=False).st_mtime > 3600:
+                        os.unlink(entry.path)
                         cleaned += 1
                 except Exception:
                     pass  # File might be in use or already deleted
@@ -1730,13 +1963,18 @@ def cleanup_orphaned_temp_files():
 # ============ CONNECT TO CHROME ============
 # FIRST: Open Chrome with: /Applications/Google\ Chrome.app/Contents/MacOS/Google\ Chrome --remote-debugging-port=9222 --user-data-dir="/tmp/chrome_dev_profile"
 # Then navigate to perplexity.ai and log in
-console.print(Panel.fit(
-    "[bold cyan]🚀 macPerplex[/bold cyan]\n[dim]Voice AI for Perplexity[/dim]",
-    border_style="cyan"
-))
-
-# Clean up any orphaned files from previous crashes
-cleanup_orphaned_temp_files()
+# Decorative panels only on a terminal; piped/nohup runs get plain lines
+if console.is_terminal:
+    console.print(Panel.fit(
+        "[bold cyan]🚀 macPerplex[/bold cyan]\n[dim]Voice AI for Perplexity[/dim]",
+        border_style="cyan"
+    ))
+else:
+    console.print("macPerplex - Voice AI for Perplexity")
+
+# Clean up any orphaned files from previous crashes (in the background, so it
+# overlaps the permission checks and the Chrome attach)
+threading.Thread(target=cleanup_orphaned_temp_files, daemon=True, name="temp-cleanup").start()
 
 # Check if OpenAI API key is set
 if not OPENAI_API_KEY or OPENAI_API_KEY.startswith("your-"):
@@ -1748,6 +1986,10 @@ if not OPENAI_API_KEY or OPENAI_API_KEY.startswith("your-"):
 # Check macOS permissions
 check_permissions()
 
+# Start the region-select overlay now so the first pedal press doesn't wait on Qt startup
+get_overlay_process()
+atexit.register(stop_overlay_process)
+
 console.print("[bold]🔗 Checking for Chrome with remote debugging...[/bold]")
 
 # First, check if Chrome is running in debug mode
@@ -1760,24 +2002,36 @@ def check_chrome_debug_mode():
     """
     # 1) Fast TCP check
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(1.0)
-        result = sock.connect_ex(("127.0.0.1", 9222))
-        sock.close()
-        if result != 0:
-            return False
+        sock = socket.create_connection(("127.0.0.1", 9222), timeout=1.0)
     except OSError:
         return False
 
-    # 2) Verify it's actually Chrome DevTools
+    # 2) Verify it's actually Chrome DevTools, reusing the same connection
+    # (a hand-written GET; the endpoint always answers with a Content-Length)
     try:
-        import json
-        import urllib.request
-
-        with urllib.request.urlopen("http://127.0.0.1:9222/json/version", timeout=1.5) as resp:
-            if resp.status != 200:
-                return False
-            data = json.loads(resp.read().decode("utf-8"))
+        with sock:
+            sock.settimeout(1.5)
+            sock.sendall(
+                b"GET /json/version HTTP/1.1\r\n"
+                b"Host: 127.0.0.1:9222\r\n"
+                b"Connection: close\r\n\r\n"
+            )
+            response = bytearray()
+            while True:
+                chunk = sock.recv(4096)
+                if not chunk:
+                    break  # Server closed the connection
+                response += chunk
+                head, sep, body = response.partition(b"\r\n\r\n")
+                length = re.search(rb"(?im)^content-length:\s*(\d+)", head) if sep else None
+                if length and len(body) >= int(length.group(1)):
+                    break
+
+        head, _, body = bytes(response).partition(b"\r\n\r\n")
+        status = head.split(b"\r\n", 1)[0].split()
+        if len(status) < 2 or status[1] != b"200":
+            return False
+        data = json.loads(body.decode("utf-8"))
 
         # Typical keys: "Browser", "webSocketDebuggerUrl"
         browser = (data.get("Browser") or "").lower()
@@ -1806,8 +2060,18 @@ if not check_chrome_debug_mode():
 console.print("[green]✓[/green] Chrome debug port detected")
 console.print("[bold]🔗 Connecting to Chrome...[/bold]")
 
+# Deferred until Chrome is known to be reachable: importing selenium.webdriver
+# loads every browser backend, which the "not in debug mode" exit doesn't need.
+# (send_to_perplexity uses WebDriverWait/EC from here.)
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
 chrome_options = Options()
 chrome_options.add_experimental_option("debuggerAddress", "127.0.0.1:9222")
+# Don't let navigations block on subresources (images, ads) after DOMContentLoaded
+chrome_options.page_load_strategy = "eager"
 
 try:
     driver = webdriver.Chrome(options=chrome_options)
@@ -1817,23 +2081,23 @@ try:
     # Create audio processor
     audio_processor = AudioProcessor()
     
-    # Format the key names nicely for display
-    key1_display = TRIGGER_KEY_WITH_SCREENSHOT.replace('_r', ' (Right)').replace('_', ' ').title()
-    key2_display = TRIGGER_KEY_AUDIO_ONLY.replace('_r', ' (Right)').replace('_', ' ').title()
-    
-    ready_text = Text()
-    ready_text.append("✅ READY! Two modes:\n\n", style="bold green")
-    ready_text.append(f"   🖼️  {key1_display} - Audio + Screenshot\n", style="bold cyan")
-    ready_text.append("      Hold, speak, release → captures window under cursor\n", style="dim")
-    ready_text.append("      OR drag to select a region while speaking!\n\n", style="dim")
-    ready_text.append(f"   🎤 {key2_display} - Audio Only\n", style="bold yellow")
-    ready_text.append("      Hold, speak, release → sends without image\n\n", style="dim")
-    ready_text.append("   💡 Tips:\n", style="italic yellow")
-    ready_text.append("      • Drag to select = better OCR for small text\n", style="dim")
-    ready_text.append("      • Keep Perplexity tab visible for faster switching\n", style="dim")
-    ready_text.append("   Press Ctrl+C to exit", style="dim")
+    ready_text = Text.assemble(
+        ("✅ READY! Two modes:\n\n", "bold green"),
+        (f"   🖼️  {SCREENSHOT_KEY_DISPLAY} - Audio + Screenshot\n", "bold cyan"),
+        ("      Hold, speak, release → captures window under cursor\n", "dim"),
+        ("      OR drag to select a region while speaking!\n\n", "dim"),
+        (f"   🎤 {AUDIO_ONLY_KEY_DISPLAY} - Audio Only\n", "bold yellow"),
+        ("      Hold, speak, release → sends without image\n\n", "dim"),
+        ("   💡 Tips:\n", "italic yellow"),
+        ("      • Drag to select = better OCR for small text\n", "dim"),
+        ("      • Keep Perplexity tab visible for faster switching\n", "dim"),
+        ("   Press Ctrl+C to exit", "dim"),
+    )
     
-    console.print(Panel(ready_text, border_style="green", expand=False))
+    if console.is_terminal:
+        console.print(Panel(ready_text, border_style="green", expand=False))
+    else:
+        console.print(ready_text)
     
     # Set up keyboard listener with both press and release handlers
     with keyboard.Listener(
@@ -4,17 +4,26 @@ PySide6 overlay for region selection.
 Run as a subprocess from macPerplex.py.
 Writes selected region to the file passed as first argument.
 
+With --daemon, stays resident and is driven over stdin instead, so the
+Python/Qt startup cost is paid once per session rather than per selection:
+    START <id>   show the overlay for selection <id>
+    STOP <id>    hide the overlay, reply "DONE <id> x,y,w,h" on stdout
+                 (just "DONE <id>" if nothing was selected)
+    QUIT         exit (also on stdin EOF)
+
 Creates separate overlay windows for each monitor to ensure proper coverage.
 """
 
 import sys
+import threading
 
 def main():
-    result_file = sys.argv[1] if len(sys.argv) > 1 else None
+    daemon = "--daemon" in sys.argv[1:]
+    result_file = None if daemon else (sys.argv[1] if len(sys.argv) > 1 else None)
     
     try:
         from PySide6.QtWidgets import QApplication, QWidget, QLabel, QRubberBand
-        from PySide6.QtCore import Qt, QRect, QPoint, QSize
+        from PySide6.QtCore import Qt, QRect, QPoint, QSize, QObject, Signal
         from PySide6.QtGui import QPainter, QColor, QCursor, QGuiApplication
     except ImportError:
         print("NO_PYSIDE6", file=sys.stderr)
@@ -100,8 +109,10 @@ def main():
 
     class OverlayCoordinator:
         """Coordinates multiple overlay windows across screens."""
-        def __init__(self, result_file):
+        def __init__(self, result_file, daemon=False):
             self.result_file = result_file
+            self.daemon = daemon
+            self.region = None  # Daemon mode: reported on STOP instead of written to a file
             self.overlays = []
             self.active_overlay = None
             
@@ -123,12 +134,14 @@ def main():
             self.active_overlay = overlay
         
         def finish_selection(self, x, y, w, h):
-            # Write result if selection is large enough
-            if w >= 50 and h >= 50 and self.result_file:
+            # Keep/write result if selection is large enough
+            if w >= 50 and h >= 50 and self.daemon:
+                self.region = f"{x},{y},{w},{h}"
+            elif w >= 50 and h >= 50 and self.result_file:
                 try:
                     with open(self.result_file, "w") as f:
                         f.write(f"{x},{y},{w},{h}")
-                except:
+                except OSError:
                     pass
             
             self.close_all()
@@ -139,16 +152,57 @@ def main():
         def close_all(self):
             for o in self.overlays:
                 o.close()
-            QApplication.quit()
+            if not self.daemon:
+                QApplication.quit()
+            elif self.overlays:
+                QApplication.restoreOverrideCursor()
+            self.overlays = []
+            self.active_overlay = None
+
+    class CommandReader(QObject):
+        """Forwards stdin lines to the Qt thread (daemon mode)."""
+        command = Signal(str)
+        
+        def run(self):
+            for line in sys.stdin:
+                self.command.emit(line.strip())
+            self.command.emit("QUIT")  # Parent went away
 
     app = QApplication(sys.argv)
-    app.setOverrideCursor(QCursor(Qt.CursorShape.CrossCursor))
     
-    coordinator = OverlayCoordinator(result_file)
-    coordinator.create_overlays()
+    if not daemon:
+        app.setOverrideCursor(QCursor(Qt.CursorShape.CrossCursor))
+        
+        coordinator = OverlayCoordinator(result_file)
+        coordinator.create_overlays()
+        
+        app.exec()
+        app.restoreOverrideCursor()
+        return
+    
+    app.setQuitOnLastWindowClosed(False)
+    coordinator = OverlayCoordinator(None, daemon=True)
+    
+    def handle_command(line):
+        cmd, _, arg = line.partition(" ")
+        if cmd == "START":
+            coordinator.close_all()
+            coordinator.region = None
+            app.setOverrideCursor(QCursor(Qt.CursorShape.CrossCursor))
+            coordinator.create_overlays()
+        elif cmd == "STOP":
+            coordinator.close_all()
+            print(f"DONE {arg} {coordinator.region or ''}".rstrip(), flush=True)
+            coordinator.region = None
+        elif cmd == "QUIT":
+            coordinator.close_all()
+            app.quit()
+    
+    reader = CommandReader()
+    reader.command.connect(handle_command, Qt.ConnectionType.QueuedConnection)
+    threading.Thread(target=reader.run, daemon=True).start()
     
     app.exec()
-    app.restoreOverrideCursor()
 
 
 if __name__ == "__main__":
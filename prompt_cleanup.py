@@ -13,6 +13,8 @@ OpenAI-compatible Chat Completions API.
 
 from __future__ import annotations
 
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Optional
 
@@ -45,6 +47,13 @@ Return ONLY the cleaned text. No preamble, no quotes, no bullet points.
 """
 
 
+# Cleanup runs at temperature 0, so a repeated transcript gets the same answer;
+# reuse recent results instead of paying another Groq round-trip.
+_CACHE_MAX_ENTRIES = 128
+_CACHE_TTL_S = 600.0
+_cache: "OrderedDict[tuple[str, str], tuple[float, str]]" = OrderedDict()
+
+
 def _collapse_whitespace(s: str) -> str:
     return " ".join((s or "").strip().split())
 
@@ -57,6 +66,12 @@ def cleanup_prompt_via_groq(text: str, cfg: CleanupConfig) -> Optional[str]:
     if not text:
         return None
 
+    key = (cfg.model, text)
+    entry = _cache.get(key)
+    if entry and time.monotonic() - entry[0] < _CACHE_TTL_S:
+        _cache.move_to_end(key)
+        return entry[1]
+
     # Import locally to keep module import cheap if feature is disabled.
     import requests
 
@@ -88,6 +103,11 @@ def cleanup_prompt_via_groq(text: str, cfg: CleanupConfig) -> Optional[str]:
             .get("content", "")
         )
         cleaned = _collapse_whitespace(content)
+        if cleaned:
+            _cache[key] = (time.monotonic(), cleaned)
+            _cache.move_to_end(key)
+            if len(_cache) > _CACHE_MAX_ENTRIES:
+                _cache.popitem(last=False)
         return cleaned or None
     except Exception:
         return None
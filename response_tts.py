@@ -186,21 +186,37 @@ def speak_local_mac(text: str, cfg: LocalTTSConfig) -> bool:
         return False
 
 
+# Candidate answer containers, in priority order (resilient to Perplexity UI changes)
+RESPONSE_NODE_XPATHS = (
+    # Common "answer prose" container
+    # Prefer div.prose containers (avoid matching li.prose-p* citation bullets)
+    "//main//div[contains(@class,'prose')]",
+    # Generic message blocks (fallback)
+    "//main//div[@role='article']",
+    "//main//article",
+)
+
+# Text of every candidate node, evaluated in the page so a poll costs one round-trip
+# instead of one find_elements per selector plus one .text call per node.
+_RESPONSE_TEXTS_JS = """
+const out = [];
+for (const xp of arguments[0]) {
+    const snap = document.evaluate(xp, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (let i = 0; i < snap.snapshotLength; i++) {
+        out.push(snap.snapshotItem(i).innerText || '');
+    }
+}
+return out;
+"""
+
+
 def find_response_nodes(driver):
     """
     Return candidate DOM nodes that likely contain assistant responses.
     We use multiple selectors to be resilient to Perplexity UI changes.
     """
-    xpaths = [
-        # Common "answer prose" container
-        # Prefer div.prose containers (avoid matching li.prose-p* citation bullets)
-        "//main//div[contains(@class,'prose')]",
-        # Generic message blocks (fallback)
-        "//main//div[@role='article']",
-        "//main//article",
-    ]
     nodes = []
-    for xp in xpaths:
+    for xp in RESPONSE_NODE_XPATHS:
         try:
             found = driver.find_elements("xpath", xp)
             if found:
@@ -210,6 +226,11 @@ def find_response_nodes(driver):
     return nodes
 
 
+def response_texts(driver) -> list[str]:
+    """Stripped text of each candidate response node (same order as find_response_nodes)."""
+    return [(t or "").strip() for t in driver.execute_script(_RESPONSE_TEXTS_JS, list(RESPONSE_NODE_XPATHS))]
+
+
 def count_response_nodes(driver) -> int:
     """Convenience wrapper used for before/after detection."""
     try:
@@ -244,32 +265,18 @@ def wait_for_latest_response_text(
 
     while time.time() < deadline:
         try:
-            nodes = find_response_nodes(driver)
-            if before_count is not None and len(nodes) <= before_count:
+            texts = response_texts(driver)
+            if before_count is not None and len(texts) <= before_count:
                 time.sleep(poll_s)
                 continue
 
             # Prefer the last node with non-empty text
             txt = ""
             if prefer_marker:
-                for node in reversed(nodes):
-                    try:
-                        t = (node.text or "").strip()
-                    except Exception:
-                        t = ""
-                    if t and prefer_marker in t:
-                        txt = t
-                        break
+                txt = next((t for t in reversed(texts) if t and prefer_marker in t), "")
 
             if not txt:
-                for node in reversed(nodes):
-                    try:
-                        t = (node.text or "").strip()
-                    except Exception:
-                        t = ""
-                    if t:
-                        txt = t
-                        break
+                txt = next((t for t in reversed(texts) if t), "")
 
             if not txt:
                 time.sleep(poll_s)